@@ -1,6 +1,7 @@
 """Fallen Knight - Main entry point."""
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -11,6 +12,7 @@ import pygame as pg
 
 from src.models.config import Config
 from src.controllers.scene_manager import SceneManager
+from src.core.constants import CACHE_STATS_ENV_VAR
 from src.core.exceptions import GameError
 from src.core.cache_manager import get_cache_manager
 
@@ -52,18 +54,14 @@ def main() -> None:
         if 'config' in locals():
             config.save()
         
+        # Close the window before any shutdown reporting
+        pg.display.quit()
+        
         # Shutdown cache manager
         if cache_manager:
             # Print cache statistics for debugging
-            if __debug__:
-                stats = cache_manager.get_stats()
-                print("\nCache Statistics:")
-                print(f"Total Memory: {stats['total_memory'] / (1024 * 1024):.2f} MB")
-                for cache_name, cache_stats in stats['caches'].items():
-                    print(f"\n{cache_name}:")
-                    print(f"  Size: {cache_stats['size']} items")
-                    print(f"  Memory: {cache_stats['memory'] / (1024 * 1024):.2f} MB")
-                    print(f"  Hit Rate: {cache_stats['hit_rate']:.2%}")
+            if os.environ.get(CACHE_STATS_ENV_VAR):
+                sys.stdout.write(cache_manager.format_stats())
             
             cache_manager.shutdown()
         
@@ -2,16 +2,28 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
+import gc
+import time
 import pygame as pg
 
 from src.core.interfaces import IScene
 from src.models.config import Config
 
 
+# Either Alt key held, read from the event modifier bitmask
+_ALT_MASK = pg.KMOD_LALT | pg.KMOD_RALT
+
+
 class BaseScene(IScene):
     """Base class for all game scenes with common functionality."""
     
+    # Scene ID this class is registered under in the SceneManager
+    CATEGORY: str = ""
+    
+    # Event types the scene reacts to; None means every event is delivered
+    EVENT_FILTER: Optional[Tuple[int, ...]] = None
+    
     def __init__(self, config: Config) -> None:
         """Initialize base scene."""
         self._config = config
@@ -20,6 +32,17 @@ class BaseScene(IScene):
         self._next_scene: Optional[str] = None
         self._delta_time = 0.0
         self._fps_limit = 0
+        self._display_version = -1
+        self._pump_interval = 0.0
+        self._next_pump_time = 0.0
+        self._cached_screen: Optional[pg.Surface] = None
+        self._screen_size: Tuple[int, int] = (0, 0)
+        
+        # Event type -> handler returning an action string; subclasses extend
+        self._handlers: Dict[int, Callable[[pg.event.Event], Optional[str]]] = {
+            pg.QUIT: self._on_quit,
+            pg.KEYDOWN: self._on_keydown,
+        }
         
         # Update FPS limit from config
         self._update_fps_limit()
@@ -32,7 +55,17 @@ class BaseScene(IScene):
     @property
     def screen(self) -> pg.Surface:
         """Get current screen surface."""
-        return self._config.screen or pg.display.get_surface()
+        screen = self._cached_screen
+        if screen is None:
+            screen = self._resolve_screen()
+        return screen
+    
+    @property
+    def screen_size(self) -> Tuple[int, int]:
+        """Get current screen size, cached alongside the surface."""
+        if self._cached_screen is None:
+            self._resolve_screen()
+        return self._screen_size
     
     @property
     def delta_time(self) -> float:
@@ -47,29 +80,56 @@ class BaseScene(IScene):
             Identifier of next scene to transition to, or None to exit
         """
         self.on_enter()
+        # Pooled scenes keep their clock; the first frame must not include
+        # the time spent in other scenes or loading this one
+        self._restart_timing()
+        
+        # Bind per-frame callables once so the loop body uses fast locals
+        pump_events = self._pump_events
+        handle_events = self.handle_events
+        update = self.update
+        render = self.render
+        present = self._present
+        tick = self._tick
         
-        while self._running and self._next_scene is None:
-            # Handle events
-            action = self.handle_events()
-            if action:
-                self._next_scene = action
-                break
-            
-            # Update
-            self.update(self._delta_time)
-            
-            # Render
-            self.render()
-            
-            # Update display
-            pg.display.flip()
-            
-            # Tick clock
-            self._tick()
+        # No cyclic GC passes mid-frame; a young-generation pass runs at scene exit
+        gc.disable()
+        try:
+            while self._running and self._next_scene is None:
+                # Handle events
+                pump_events()
+                action = handle_events()
+                if action:
+                    self._next_scene = action
+                    break
+                
+                # Update
+                update(self._delta_time)
+                
+                # Render
+                render()
+                
+                # Update display
+                present()
+                
+                # Tick clock
+                tick()
+        finally:
+            gc.enable()
         
         self.on_exit()
+        gc.collect(0)
         return self._next_scene
     
+    def reset(self, **kwargs) -> None:
+        """Re-initialize a pooled scene instance for reuse. Override in subclasses."""
+        self._running = True
+        self._next_scene = None
+    
+    def invalidate_screen(self) -> None:
+        """Drop the cached screen surface and size after a display mode change."""
+        self._cached_screen = None
+    
     def transition_to(self, scene_id: str) -> None:
         """Request transition to another scene."""
         self._next_scene = scene_id
@@ -80,11 +140,25 @@ class BaseScene(IScene):
         self._running = True
         self._next_scene = None
         self._update_fps_limit()
+        # Display may have been recreated while another scene was active
+        self.invalidate_screen()
+        self._apply_event_filter()
     
     def on_exit(self) -> None:
         """Called when scene becomes inactive. Override in subclasses."""
         pass
     
+    def _resolve_screen(self) -> pg.Surface:
+        """Look up the display surface and cache it with its size."""
+        screen = self._config.screen or pg.display.get_surface()
+        self._cached_screen = screen
+        self._screen_size = screen.get_size()
+        return screen
+    
+    def _present(self) -> None:
+        """Push the rendered frame to the display. Override in subclasses."""
+        pg.display.flip()
+    
     def _tick(self) -> None:
         """Update clock and calculate delta time."""
         # Use vsync or FPS limit
@@ -93,9 +167,50 @@ class BaseScene(IScene):
         else:
             self._delta_time = self._clock.tick(self._fps_limit) / 1000.0
     
+    def _restart_timing(self) -> None:
+        """Start frame timing afresh so the next delta covers only one frame."""
+        self._clock.tick()
+        self._delta_time = 0.0
+    
     def _update_fps_limit(self) -> None:
-        """Update FPS limit from config."""
+        """Update FPS limit from config if display settings changed."""
+        version = self._config.display_version
+        if version == self._display_version:
+            return
+        self._display_version = version
+        
         self._fps_limit = self._config.display.fps_limit
+        self._pump_interval = 1.0 / max(self._fps_limit, 60)
+    
+    def _apply_event_filter(self) -> None:
+        """Keep SDL from queueing event types this scene never reads."""
+        if self.EVENT_FILTER is None:
+            pg.event.set_allowed(None)
+            return
+        
+        pg.event.set_blocked(None)
+        pg.event.set_allowed(self.EVENT_FILTER)
+    
+    def _pump_events(self) -> None:
+        """Pump SDL events no faster than once per frame period."""
+        now = time.perf_counter()
+        if now >= self._next_pump_time:
+            pg.event.pump()
+            self._next_pump_time = now + self._pump_interval
+    
+    def _poll_events(self) -> List[pg.event.Event]:
+        """
+        Fetch pending events, filtered by EVENT_FILTER at the SDL level.
+        
+        The queue is read without pumping (see _pump_events). Events outside
+        the filter are dropped so they don't pile up in the queue.
+        """
+        if self.EVENT_FILTER is None:
+            return pg.event.get(pump=False)
+        
+        events = pg.event.get(self.EVENT_FILTER, pump=False)
+        pg.event.clear(pump=False)
+        return events
     
     def _handle_common_events(self, event: pg.event.Event) -> Optional[str]:
         """
@@ -104,14 +219,19 @@ class BaseScene(IScene):
         Returns:
             Action string if event should trigger scene change
         """
-        if event.type == pg.QUIT:
-            return "exit"
-        
+        handler = self._handlers.get(event.type)
+        if handler is None:
+            return None
+        return handler(event)
+    
+    def _on_quit(self, event: pg.event.Event) -> Optional[str]:
+        """Handle window close request."""
+        return "exit"
+    
+    def _on_keydown(self, event: pg.event.Event) -> Optional[str]:
+        """Handle keys shared by all scenes."""
         # Handle alt+enter for fullscreen toggle
-        if event.type == pg.KEYDOWN:
-            keys = pg.key.get_pressed()
-            if event.key == pg.K_RETURN and (keys[pg.K_LALT] or keys[pg.K_RALT]):
-                self._config.toggle_fullscreen()
-                return None
-        
-        return None
\ No newline at end of file
+        if event.key == pg.K_RETURN and event.mod & _ALT_MASK:
+            self._config.toggle_fullscreen()
+            self.invalidate_screen()
+        return None
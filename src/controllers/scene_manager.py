@@ -1,21 +1,38 @@
 """Scene manager for coordinating scene transitions."""
 from __future__ import annotations
 
-from typing import Dict, Optional, Type
+from typing import Dict, Optional, Tuple, Type
 from pathlib import Path
+from types import MappingProxyType
 import gc
+import importlib
+import struct
 
 from src.controllers.base.scene import BaseScene
-from src.controllers.scenes.menu_scene import MenuScene
-from src.controllers.scenes.game_scene import GameScene
-from src.controllers.scenes.settings_scene import SettingsScene
-from src.controllers.scenes.dialog_scene import DialogScene
 from src.models.config import Config
-from src.core.constants import SAVE_FILE
+from src.models.save_data import SavedData, wait_for_save
+from src.core.constants import SAVE_FILE, SAVE_FILE_MAGIC, SAVE_HEADER_FORMAT
 from src.core.exceptions import SceneError
 from src.core.cache_manager import get_cache_manager
 
 
+# Map action strings to scene IDs
+_TRANSITION_MAP = MappingProxyType({
+    "exit": None,
+    "menu": "menu",
+    "settings": "settings",
+    "back": "menu",
+    "new_game": "new_game",
+    "continue": "continue",
+    "game": "game",
+    "game_over": "menu",  # TODO: Add game over scene
+    "level_complete": "menu",  # TODO: Add level complete scene
+})
+
+# Scenes kept alive for the whole session instead of being pooled
+_CACHED_CATEGORIES = frozenset({"menu", "settings"})
+
+
 class SceneManager:
     """Manages scene creation and transitions."""
     
@@ -25,17 +42,25 @@ class SceneManager:
         self._current_scene: Optional[BaseScene] = None
         self._scene_cache: Dict[str, BaseScene] = {}
         
-        # Scene registry
-        self._scene_classes: Dict[str, Type[BaseScene]] = {
-            "menu": MenuScene,
-            "settings": SettingsScene,
-            "game": GameScene,
-            "dialog": DialogScene,
+        # Idle instances of per-session scenes (game, dialog), reset on reuse
+        self._scene_pool: Dict[str, BaseScene] = {}
+        
+        # Scene registry ("module:Class"), imported on first use
+        self._scene_classes: Dict[str, str] = {
+            "menu": "src.controllers.scenes.menu_scene:MenuScene",
+            "settings": "src.controllers.scenes.settings_scene:SettingsScene",
+            "game": "src.controllers.scenes.game_scene:GameScene",
+            "dialog": "src.controllers.scenes.dialog_scene:DialogScene",
         }
+        self._resolved_classes: Dict[str, Type[BaseScene]] = {}
         
         # Game state
         self._current_level = "tutorial"
-        self._saved_data = None
+        self._saved_data: Optional[SavedData] = None
+        
+        # Last parsed save keyed by file (mtime, size)
+        self._save_cache_key: Optional[Tuple[int, int]] = None
+        self._save_cache_value: Optional[SavedData] = None
         
         # Cache manager
         self._cache_manager = get_cache_manager()
@@ -53,6 +78,11 @@ class SceneManager:
             if not scene:
                 raise SceneError(f"Unknown scene: {current_scene_id}")
             
+            # Move objects loaded at startup (config, caches, menu assets)
+            # out of the collector's reach so later passes skip them
+            if previous_scene is None:
+                gc.freeze()
+            
             # Clean up previous scene if different
             if previous_scene and previous_scene != scene:
                 self._cleanup_scene(previous_scene)
@@ -88,7 +118,7 @@ class SceneManager:
             return self._create_scene("game", level_id=self._current_level, saved_data=self._saved_data)
         
         # Check cache for reusable scenes
-        if scene_id in ["menu", "settings"]:
+        if scene_id in _CACHED_CATEGORIES:
             if scene_id not in self._scene_cache:
                 self._scene_cache[scene_id] = self._create_scene(scene_id)
             return self._scene_cache[scene_id]
@@ -98,101 +128,123 @@ class SceneManager:
     
     def _create_scene(self, scene_id: str, **kwargs) -> Optional[BaseScene]:
         """Create a new scene instance."""
-        scene_class = self._scene_classes.get(scene_id)
+        scene_class = self._resolve_scene_class(scene_id)
         
         if not scene_class:
             return None
         
+        # Arguments for the scene constructor / reset
+        if scene_id == "game":
+            scene_kwargs = {
+                "level_id": kwargs.get("level_id", self._current_level),
+                "saved_data": kwargs.get("saved_data"),
+            }
+        elif scene_id == "dialog":
+            scene_kwargs = {
+                "dialog_id": kwargs.get("dialog_id", "test"),
+                "next_scene": kwargs.get("next_scene", "menu"),
+            }
+        else:
+            scene_kwargs = {}
+        
         try:
-            # Create scene with appropriate arguments
-            if scene_id == "game":
-                return scene_class(
-                    self._config,
-                    level_id=kwargs.get("level_id", self._current_level),
-                    saved_data=kwargs.get("saved_data")
-                )
-            elif scene_id == "dialog":
-                return scene_class(
-                    self._config,
-                    dialog_id=kwargs.get("dialog_id", "test"),
-                    next_scene=kwargs.get("next_scene", "menu")
-                )
-            else:
-                return scene_class(self._config)
+            # Reuse pooled instance if one is idle
+            pooled = self._scene_pool.pop(scene_id, None)
+            if pooled is not None:
+                pooled.reset(**scene_kwargs)
+                return pooled
+            
+            return scene_class(self._config, **scene_kwargs)
                 
         except Exception as e:
             raise SceneError(f"Failed to create scene {scene_id}: {e}")
     
+    def _resolve_scene_class(self, scene_id: str) -> Optional[Type[BaseScene]]:
+        """Import scene class for ID on first use and cache it."""
+        scene_class = self._resolved_classes.get(scene_id)
+        if scene_class is not None:
+            return scene_class
+        
+        target = self._scene_classes.get(scene_id)
+        if not target:
+            return None
+        
+        module_name, class_name = target.split(":")
+        scene_class = importlib.import_module(module_name).__dict__[class_name]
+        self._resolved_classes[scene_id] = scene_class
+        return scene_class
+    
     def _handle_transition(self, from_scene: str, to_scene: Optional[str]) -> Optional[str]:
         """Handle special scene transitions."""
         if not to_scene:
             return None
         
-        # Map action strings to scene IDs
-        transition_map = {
-            "exit": None,
-            "menu": "menu",
-            "settings": "settings",
-            "back": "menu",
-            "new_game": "new_game",
-            "continue": "continue",
-            "game": "game",
-            "game_over": "menu",  # TODO: Add game over scene
-            "level_complete": "menu",  # TODO: Add level complete scene
-        }
-        
-        return transition_map.get(to_scene, to_scene)
+        return _TRANSITION_MAP.get(to_scene, to_scene)
     
     def _load_saved_game(self) -> None:
-        """Load saved game data."""
+        """Load saved game data, reusing the last parse if the file is unchanged."""
+        wait_for_save()
         try:
-            save_path = Path(SAVE_FILE)
-            if save_path.exists():
-                with open(save_path, 'r') as f:
-                    data = f.read().strip().split()
-                    if len(data) >= 3:
-                        x = float(data[0])
-                        y = float(data[1])
-                        health = int(data[2])
-                        self._saved_data = (x, y, health)
-                        
-                        # Load level ID if available
-                        if len(data) >= 4:
-                            self._current_level = data[3]
-        except (IOError, ValueError):
+            stat = Path(SAVE_FILE).stat()
+        except OSError:
+            return
+        
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if cache_key == self._save_cache_key:
+            self._saved_data = self._save_cache_value
+            self._current_level = self._saved_data.level
+            return
+        
+        try:
+            with open(SAVE_FILE, 'rb') as f:
+                buffer = f.read()
+            
+            if buffer.startswith(SAVE_FILE_MAGIC):
+                _, x, y, health = struct.unpack_from(SAVE_HEADER_FORMAT, buffer, 0)
+                level_id = buffer[struct.calcsize(SAVE_HEADER_FORMAT):].decode('utf-8')
+                saved_data = SavedData(x, y, health, level_id or self._current_level)
+            else:
+                saved_data = self._load_text_save(buffer.decode('utf-8'))
+        except (IOError, ValueError, struct.error):
             self._saved_data = None
+            return
+        
+        if saved_data is None:
+            return
+        
+        self._saved_data = saved_data
+        self._current_level = saved_data.level
+        self._save_cache_key = cache_key
+        self._save_cache_value = saved_data
+    
+    def _load_text_save(self, text: str) -> Optional[SavedData]:
+        """Parse legacy whitespace-separated save format."""
+        data = text.strip().split()
+        if len(data) < 3:
+            return None
+        
+        # Level ID is optional in old saves
+        level_id = data[3] if len(data) >= 4 else self._current_level
+        return SavedData(float(data[0]), float(data[1]), int(data[2]), level_id)
     
     def _cleanup_scene(self, scene: BaseScene) -> None:
-        """Clean up resources for a scene."""
-        # Don't clean up cached scenes (menu, settings)
-        scene_type = type(scene).__name__.lower().replace("scene", "")
-        if scene_type in ["menu", "settings"]:
+        """Pool a finished scene for reuse."""
+        # Cached scenes (menu, settings) are kept elsewhere
+        category = scene.CATEGORY
+        if category in _CACHED_CATEGORIES:
             return
         
-        # For game scenes, clear certain caches
-        if isinstance(scene, GameScene):
-            # Clear collision caches (they have TTL anyway)
-            collision_cache = self._cache_manager.get_cache("collision_groups")
-            if collision_cache:
-                collision_cache.clear()
-            
-            # Optionally clear tile surface cache if memory is high
-            total_memory = self._cache_manager.get_total_memory()
-            if total_memory > 150 * 1024 * 1024:  # 150MB threshold
-                tile_cache = self._cache_manager.get_cache("tile_surfaces")
-                if tile_cache:
-                    # Remove oldest entries to free up space
-                    while tile_cache._total_memory > 30 * 1024 * 1024:  # Keep max 30MB
-                        if not tile_cache._evict_one():
-                            break
-        
-        # Force garbage collection for large scenes
-        gc.collect()
+        # Keep the instance for reuse instead of rebuilding it next time
+        self._scene_pool[category] = scene
     
     def _cleanup(self) -> None:
         """Clean up all resources."""
-        # Clear scene cache
+        # Clear scene cache and pool
         self._scene_cache.clear()
+        self._scene_pool.clear()
+        
+        # Make sure the last game save is on disk before exiting
+        wait_for_save()
         
         # Save configuration
         self._config.save()
@@ -1,5 +1,21 @@
 """Scene controllers."""
-from src.controllers.scenes.menu_scene import MenuScene
-from src.controllers.scenes.game_scene import GameScene
-from src.controllers.scenes.settings_scene import SettingsScene
-from src.controllers.scenes.dialog_scene import DialogScene
\ No newline at end of file
+from importlib import import_module
+
+# Scene classes are imported lazily so only the active scene's
+# renderers and assets are loaded
+_SCENE_MODULES = {
+    "MenuScene": "src.controllers.scenes.menu_scene",
+    "GameScene": "src.controllers.scenes.game_scene",
+    "SettingsScene": "src.controllers.scenes.settings_scene",
+    "DialogScene": "src.controllers.scenes.dialog_scene",
+}
+
+__all__ = list(_SCENE_MODULES)
+
+
+def __getattr__(name: str):
+    """Import scene class on first attribute access."""
+    module_name = _SCENE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name), name)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Dialog scene controller for standalone story sequences."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 import pygame as pg
 
@@ -9,13 +9,20 @@ from src.controllers.base.scene import BaseScene
 from src.views.renderers.dialog_renderer import DialogRenderer
 from src.models.ui.dialog import get_dialog_manager, DialogSequence
 from src.models.config import Config
-from src.core.constants import AssetPaths
+from src.core.constants import AssetPaths, DIALOG_IDLE_TIMEOUT_MS
 from src.core.exceptions import DialogError
 
 
+# Event types the dialog reacts to (mouse motion and window spam is dropped)
+_DIALOG_EVENT_FILTER = (pg.QUIT, pg.KEYDOWN, pg.MOUSEBUTTONDOWN)
+
+
 class DialogScene(BaseScene):
     """Standalone dialog scene for story sequences."""
     
+    CATEGORY = "dialog"
+    EVENT_FILTER = _DIALOG_EVENT_FILTER
+    
     def __init__(
         self,
         config: Config,
@@ -40,25 +47,62 @@ class DialogScene(BaseScene):
         self._next_scene_id = next_scene
         self._sequence: Optional[DialogSequence] = None
         
+        # Areas changed by the last render; full flip until the first frame is shown
+        self._dirty_rects: List[pg.Rect] = []
+        self._needs_full_flip = True
+        
+        # Every accepted event type maps straight to its handler
+        self._handlers[pg.KEYDOWN] = self._on_dialog_key
+        self._handlers[pg.MOUSEBUTTONDOWN] = self._on_dialog_input
+        
         # Load dialog sequence
         self._load_dialog()
     
+    def reset(self, dialog_id: str, next_scene: str = "game") -> None:
+        """
+        Re-initialize a pooled scene for another dialog sequence.
+        
+        Args:
+            dialog_id: ID of dialog sequence to play
+            next_scene: Scene to transition to after dialog
+        """
+        super().reset()
+        self._dialog_id = dialog_id
+        self._next_scene_id = next_scene
+        self._load_dialog()
+    
     def handle_events(self) -> Optional[str]:
         """Process dialog input events."""
-        for event in pg.event.get():
-            # Handle common events
-            action = self._handle_common_events(event)
-            if action:
-                return action
-            
-            # Let renderer handle dialog events
-            if self._renderer.handle_event(event):
-                # Check if dialog finished
-                if self._renderer.is_finished():
-                    return self._next_scene_id
+        events = self._poll_events()
+        
+        # Nothing queued and no transition running: sleep in SDL until input
+        # arrives or the idle timeout passes instead of spinning at fps_limit
+        if not events and not self._renderer.is_animating():
+            event = pg.event.wait(DIALOG_IDLE_TIMEOUT_MS)
+            if event.type in self.EVENT_FILTER:
+                events = [event]
+        
+        handlers = self._handlers
+        for event in events:
+            handler = handlers.get(event.type)
+            if handler is not None:
+                action = handler(event)
+                if action:
+                    return action
         
         return None
     
+    def _on_dialog_key(self, event: pg.event.Event) -> Optional[str]:
+        """Apply common key handling, then pass the key to the dialog."""
+        self._on_keydown(event)
+        return self._on_dialog_input(event)
+    
+    def _on_dialog_input(self, event: pg.event.Event) -> Optional[str]:
+        """Let renderer handle dialog input and report when it finishes."""
+        if self._renderer.handle_event(event) and self._renderer.is_finished():
+            return self._next_scene_id
+        return None
+    
     def update(self, delta_time: float) -> None:
         """Update dialog state."""
         # Dialog updates are handled by renderer
@@ -66,17 +110,20 @@ class DialogScene(BaseScene):
     
     def render(self) -> None:
         """Render dialog scene."""
-        self._renderer.render(self.screen)
+        self._dirty_rects = self._renderer.render(self.screen)
     
     def on_enter(self) -> None:
         """Called when entering dialog scene."""
         super().on_enter()
         
         # Update screen reference
-        self._renderer.update_screen_size(self.screen.get_width(), self.screen.get_height())
+        self._renderer.update_screen_size(*self.screen_size)
         
         # Stop any playing music
         pg.mixer.music.stop()
+        
+        # Whatever the previous scene left on screen must be replaced entirely
+        self._needs_full_flip = True
     
     def on_exit(self) -> None:
         """Called when exiting dialog scene."""
@@ -85,6 +132,14 @@ class DialogScene(BaseScene):
         # Stop any playing sounds
         pg.mixer.stop()
     
+    def _present(self) -> None:
+        """Upload only the changed screen areas once the first frame is shown."""
+        if self._needs_full_flip or not self._dirty_rects:
+            pg.display.flip()
+            self._needs_full_flip = False
+        else:
+            pg.display.update(self._dirty_rects)
+    
     def _load_dialog(self) -> None:
         """Load dialog sequence from file."""
         dialog_manager = get_dialog_manager()
@@ -1,30 +1,62 @@
 """Game scene controller with gameplay logic."""
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from pathlib import Path
+import struct
 import pygame as pg
+from pygame.math import clamp
 
 from src.controllers.base.scene import BaseScene
 from src.views.renderers.game_renderer import GameRenderer
 from src.views.ui.dialog_overlay import DialogOverlay
+from src.views.ui.fonts import get_font
 from src.models.entities.player import Player, PlayerAction
 from src.models.world.level import Level
 from src.models.ui.dialog import get_dialog_manager
 from src.models.config import Config
-from src.core.constants import AssetPaths, GRAVITY, MAX_FALL_SPEED, SAVE_FILE, PlayerConstants
+from src.models.save_data import SavedData, write_save
+from src.core.constants import (
+    AssetPaths, GRAVITY, MAX_FALL_SPEED, SAVE_FILE_MAGIC,
+    SAVE_HEADER_FORMAT, PlayerConstants
+)
 from src.core.exceptions import LevelError
 from src.core.cache_manager import get_cache_manager
 
 
+# Trigger tile kinds checked against the player every frame
+_TRIGGER_IDS = ("dialog", "checkpoint", "exit")
+
+# Level IDs with an intro dialog file; None until the dialog folder is scanned
+_INTRO_SUFFIX = "_intro.json"
+_intro_levels: Optional[FrozenSet[str]] = None
+
+
+def _get_intro_levels() -> FrozenSet[str]:
+    """Get IDs of levels with an intro dialog, scanning the disk only once."""
+    global _intro_levels
+    if _intro_levels is None:
+        try:
+            _intro_levels = frozenset(
+                path.name[:-len(_INTRO_SUFFIX)]
+                for path in Path(AssetPaths.GAME_DIALOGS).glob(f"*{_INTRO_SUFFIX}")
+            )
+        except OSError:
+            _intro_levels = frozenset()
+    return _intro_levels
+
+
 class GameScene(BaseScene):
     """Main gameplay scene with physics and rendering."""
     
+    CATEGORY = "game"
+    EVENT_FILTER = (pg.QUIT, pg.KEYDOWN, pg.KEYUP, pg.MOUSEBUTTONDOWN)
+    
     def __init__(
         self,
         config: Config,
         level_id: str = "tutorial",
-        saved_data: Optional[Tuple[float, float, int]] = None
+        saved_data: Optional[SavedData] = None
     ) -> None:
         """
         Initialize game scene.
@@ -40,39 +72,43 @@ class GameScene(BaseScene):
         self._renderer = GameRenderer()
         self._dialog_overlay = DialogOverlay()
         
-        # Load level
-        self._level_id = level_id
-        self._level = self._load_level(level_id)
-        
-        # Create player
-        if saved_data:
-            x, y, health = saved_data
-            self._player = Player(x, y, health)
-        else:
-            spawn = self._level.spawn_point
-            # Adjust spawn so player sprite is fully inside level bounds
-            sprite_w, sprite_h = PlayerConstants.SPRITE_SIZE
-            adjusted_x = max(0, min(spawn.x, self._level.bounds.width - sprite_w))
-            adjusted_y = max(0, min(spawn.y - sprite_h, self._level.bounds.height - sprite_h))
-            self._player = Player(adjusted_x, adjusted_y)
-        
-        # Entity management
-        self._entities = pg.sprite.Group()
-        self._entities.add(self._player)
-        
-        # Input mapping
-        self._create_input_mapping()
-        
         # Game state
-        self._paused = False
         self._debug_mode = False
         
+        # Pause overlay blits, rebuilt only when the screen size changes
+        self._pause_blits: List[Tuple[pg.Surface, pg.Rect]] = []
+        self._pause_size: Tuple[int, int] = (0, 0)
+        
+        # Load level, player and input mapping
+        self._setup(level_id, saved_data)
+        
         # Cache manager
         self._cache_manager = get_cache_manager()
     
+    def reset(
+        self,
+        level_id: str = "tutorial",
+        saved_data: Optional[SavedData] = None
+    ) -> None:
+        """
+        Re-initialize a pooled scene for a new play session.
+        
+        Renderer, HUD assets and dialog overlay surfaces are kept.
+        
+        Args:
+            level_id: Level to load
+            saved_data: Optional saved player data (x, y, health)
+        """
+        super().reset()
+        self._dialog_overlay.reset()
+        self._setup(level_id, saved_data)
+    
     def handle_events(self) -> Optional[str]:
         """Process game input events."""
-        for event in pg.event.get():
+        # One timestamp per frame for every input event handled in it
+        now = pg.time.get_ticks()
+        
+        for event in self._poll_events():
             # Let dialog overlay handle events first
             if self._dialog_overlay.is_visible():
                 if self._dialog_overlay.handle_event(event):
@@ -105,7 +141,7 @@ class GameScene(BaseScene):
             
             elif event.type == pg.MOUSEBUTTONDOWN:
                 if not self._paused and not self._dialog_overlay.is_visible():
-                    self._player.handle_mouse_click(event.button, pg.time.get_ticks())
+                    self._player.handle_mouse_click(event.button, now)
         
         return None
     
@@ -157,10 +193,7 @@ class GameScene(BaseScene):
         self._renderer.camera.set_world_bounds(self._level.bounds)
         
         # Update dialog overlay screen size
-        self._dialog_overlay.update_screen_size(
-            self.screen.get_width(),
-            self.screen.get_height()
-        )
+        self._dialog_overlay.update_screen_size(*self.screen_size)
         
         # Stop menu music
         pg.mixer.music.stop()
@@ -182,36 +215,77 @@ class GameScene(BaseScene):
         if hasattr(self._level, 'cleanup'):
             self._level.cleanup()
     
+    def _setup(self, level_id: str, saved_data: Optional[SavedData]) -> None:
+        """Load level and create player and entities."""
+        # Load level
+        self._level_id = level_id
+        self._level = self._load_level(level_id)
+        
+        # Create player
+        if saved_data:
+            self._player = Player(saved_data.x, saved_data.y, saved_data.health)
+        else:
+            spawn = self._level.spawn_point
+            # Adjust spawn so player sprite is fully inside level bounds
+            sprite_w, sprite_h = PlayerConstants.SPRITE_SIZE
+            adjusted_x = max(0, min(spawn.x, self._level.bounds.width - sprite_w))
+            adjusted_y = max(0, min(spawn.y - sprite_h, self._level.bounds.height - sprite_h))
+            self._player = Player(adjusted_x, adjusted_y)
+        
+        # Entity management
+        self._entities = pg.sprite.Group()
+        self._entities.add(self._player)
+        
+        # Trigger groups the player can activate; absent kinds are skipped
+        self._trigger_groups: Dict[str, Tuple[pg.Rect, pg.sprite.Group]] = {}
+        for trigger_id in _TRIGGER_IDS:
+            trigger_bounds = self._level.get_trigger_bounds(trigger_id)
+            if trigger_bounds is not None:
+                self._trigger_groups[trigger_id] = (
+                    trigger_bounds,
+                    self._level.get_all_trigger_tiles(trigger_id)
+                )
+        
+        # Input mapping
+        self._create_input_mapping()
+        
+        self._paused = False
+    
     def _create_input_mapping(self) -> None:
         """Create input action mappings."""
         kb = self.config.key_bindings
         
-        self._key_down_actions = {
-            kb.left: lambda: self._player.handle_action(PlayerAction.MOVE_LEFT, True),
-            kb.right: lambda: self._player.handle_action(PlayerAction.MOVE_RIGHT, True),
-            kb.jump: lambda: self._player.handle_action(PlayerAction.JUMP, True),
-            kb.sprint: lambda: self._player.handle_action(PlayerAction.SPRINT, True),
-            kb.block: lambda: self._player.handle_action(PlayerAction.BLOCK, True),
+        # Keyed by keycode in dicts: SDL2 keycodes for arrows and other
+        # non-character keys carry bit 30, so a keycode-indexed list won't do
+        self._key_down_actions: Dict[int, PlayerAction] = {
+            kb.left: PlayerAction.MOVE_LEFT,
+            kb.right: PlayerAction.MOVE_RIGHT,
+            kb.jump: PlayerAction.JUMP,
+            kb.sprint: PlayerAction.SPRINT,
+            kb.block: PlayerAction.BLOCK,
         }
         
-        self._key_up_actions = {
-            kb.left: lambda: self._player.handle_action(PlayerAction.MOVE_LEFT, False),
-            kb.right: lambda: self._player.handle_action(PlayerAction.MOVE_RIGHT, False),
-            kb.sprint: lambda: self._player.handle_action(PlayerAction.SPRINT, False),
-            kb.block: lambda: self._player.handle_action(PlayerAction.BLOCK, False),
+        # Jump only reacts to presses
+        self._key_up_actions: Dict[int, PlayerAction] = {
+            kb.left: PlayerAction.MOVE_LEFT,
+            kb.right: PlayerAction.MOVE_RIGHT,
+            kb.sprint: PlayerAction.SPRINT,
+            kb.block: PlayerAction.BLOCK,
         }
+        
+        self._handle_player_action = self._player.handle_action
     
     def _handle_key_down(self, key: int) -> None:
         """Handle key down event."""
         action = self._key_down_actions.get(key)
-        if action:
-            action()
+        if action is not None:
+            self._handle_player_action(action, True)
     
     def _handle_key_up(self, key: int) -> None:
         """Handle key up event."""
         action = self._key_up_actions.get(key)
-        if action:
-            action()
+        if action is not None:
+            self._handle_player_action(action, False)
     
     def _load_level(self, level_id: str) -> Level:
         """Load level from file."""
@@ -230,98 +304,97 @@ class GameScene(BaseScene):
         """Handle player movement, physics, and collisions by axis."""
         player = self._player
         
+        # Bind the player's vectors and rect once; all are mutated in place
+        position = player.position
+        velocity = player.velocity
+        rect = player.rect
+        
         # 1. Apply acceleration to velocity (from player's update)
-        player.velocity += player.acceleration * delta_time
+        velocity += player.acceleration * delta_time
         
         # Clamp velocity to maximum values
-        max_vel = player.max_velocity
-        player.velocity.x = max(-max_vel.x, min(player.velocity.x, max_vel.x))
-        player.velocity.y = max(-max_vel.y, min(player.velocity.y, max_vel.y))
+        max_x, max_y = player.max_velocity
+        velocity.x = clamp(velocity.x, -max_x, max_x)
+        velocity.y = clamp(velocity.y, -max_y, max_y)
         
         # Store position before vertical movement for platform check
-        original_y = player.position.y
+        original_y = position.y
         
-        # Get collidable geometry using cached groups
-        collidable_tiles = self._level.get_all_collidable_tiles()
-        platform_tiles = self._level.get_all_platform_tiles()
-        hazard_tiles = self._level.get_all_hazard_tiles()
+        # Query collidable geometry through the level's grid index
+        level = self._level
+        collidable_grid = level.collidable_grid
+        platform_grid = level.platform_grid
         
         # 2. Horizontal movement and collision
-        player.position.x += player.velocity.x * delta_time
-        player.rect.centerx = int(player.position.x)
-        
-        hit_list = pg.sprite.spritecollide(player, collidable_tiles, dokill=False)
-        for tile in hit_list:
-            if player.velocity.x > 0:  # Moving right
-                player.rect.right = tile.rect.left
-            elif player.velocity.x < 0:  # Moving left
-                player.rect.left = tile.rect.right
-            player.position.x = float(player.rect.centerx)
-            player.velocity.x = 0
+        position.x += velocity.x * delta_time
+        rect.centerx = int(position.x)
+        
+        # Resolution only needs tile geometry, not the tile sprites
+        hit_list = level.query_rects(rect, collidable_grid)
+        for tile_rect in hit_list:
+            if velocity.x > 0:  # Moving right
+                rect.right = tile_rect.left
+            elif velocity.x < 0:  # Moving left
+                rect.left = tile_rect.right
+            position.x = float(rect.centerx)
+            velocity.x = 0
             
         # 3. Vertical movement and collision
         # Capture initial vertical velocity direction BEFORE movement for proper collision resolution
-        vy_initial = player.velocity.y
-        player.position.y += player.velocity.y * delta_time
-        player.rect.centery = int(player.position.y)
+        vy_initial = velocity.y
+        position.y += velocity.y * delta_time
+        rect.centery = int(position.y)
 
-        player.on_ground = False
+        on_ground = False
         
         # Check for solid tile collisions
-        hit_list = pg.sprite.spritecollide(player, collidable_tiles, dokill=False)
-        if vy_initial > 0:  # Falling downward
-            for tile in hit_list:
-                player.rect.bottom = tile.rect.top
-                player.on_ground = True
-                player.velocity.y = 0
-                player.position.y = float(player.rect.centery)
-        elif vy_initial < 0:  # Moving upward (head bump)
-            for tile in hit_list:
-                player.rect.top = tile.rect.bottom
-                player.velocity.y = 0
-                player.position.y = float(player.rect.centery)
+        hit_list = level.query_rects(rect, collidable_grid)
+        if vy_initial < 0:  # Moving upward (head bump)
+            for tile_rect in hit_list:
+                rect.top = tile_rect.bottom
+                velocity.y = 0
+                position.y = float(rect.centery)
         else:
-            # vy_initial == 0 (edge case) – treat as downward for stability
-            for tile in hit_list:
-                player.rect.bottom = tile.rect.top
-                player.on_ground = True
-                player.velocity.y = 0
-                player.position.y = float(player.rect.centery)
+            # Falling downward; vy_initial == 0 (edge case) is treated the same for stability
+            for tile_rect in hit_list:
+                rect.bottom = tile_rect.top
+                on_ground = True
+                velocity.y = 0
+                position.y = float(rect.centery)
 
         # 4. One-way platform collision
-        if player.velocity.y >= 0:
-            # Don't check for platforms if already on solid ground
-            if not player.on_ground:
-                platform_hits = pg.sprite.spritecollide(player, platform_tiles, dokill=False)
-                for platform in platform_hits:
-                    # Player's feet must be above the platform's top and not passing up through it
-                    is_passing_through = original_y + player.rect.height / 2 > platform.rect.top + 1
-                    if player.rect.bottom > platform.rect.top and not is_passing_through:
-                        player.rect.bottom = platform.rect.top
-                        player.on_ground = True
-                        player.velocity.y = 0
-                        player.position.y = float(player.rect.centery)
+        # Don't check for platforms if already on solid ground
+        if velocity.y >= 0 and not on_ground:
+            platform_hits = level.query_rects(rect, platform_grid)
+            for platform_rect in platform_hits:
+                # Player's feet must be above the platform's top and not passing up through it
+                platform_top = platform_rect.top
+                is_passing_through = original_y + rect.height / 2 > platform_top + 1
+                if rect.bottom > platform_top and not is_passing_through:
+                    rect.bottom = platform_top
+                    on_ground = True
+                    velocity.y = 0
+                    position.y = float(rect.centery)
 
         # Non-intrusive ground adjacency check (1px below)
-        if not player.on_ground and player.velocity.y == 0:
-            test_rect = player.rect.move(0, 1)
-            ground_tiles = collidable_tiles.sprites() + platform_tiles.sprites()
-            for tile in ground_tiles:
-                if test_rect.colliderect(tile.rect):
-                    player.on_ground = True
-                    break
+        if not on_ground and velocity.y == 0:
+            if level.overlaps_tiles(rect.move(0, 1), level.ground_grid):
+                on_ground = True
+        
+        player.on_ground = on_ground
 
         # 5. Hazard collision
-        if pg.sprite.spritecollide(player, hazard_tiles, dokill=False):
+        if level.overlaps_tiles(player.rect, level.hazard_grid):
             if not player.is_invulnerable:
                 player.take_damage(10)
     
     def _check_triggers(self) -> None:
         """Check for trigger tile activation."""
-        # Get all trigger groups from level
-        for trigger_id in ["dialog", "checkpoint", "exit"]:
-            trigger_tiles = self._level.get_all_trigger_tiles(trigger_id)
-            
+        player_rect = self._player.rect
+        for trigger_id, (trigger_bounds, trigger_tiles) in self._trigger_groups.items():
+            # Skip the per-tile scan while the player is nowhere near the trigger
+            if not player_rect.colliderect(trigger_bounds):
+                continue
             if pg.sprite.spritecollide(self._player, trigger_tiles, False):
                 self._activate_trigger(trigger_id)
     
@@ -336,18 +409,19 @@ class GameScene(BaseScene):
     
     def _check_intro_dialog(self) -> None:
         """Check if level has intro dialog."""
-        dialog_manager = get_dialog_manager()
-        dialog_path = Path(AssetPaths.GAME_DIALOGS) / f"{self._level_id}_intro.json"
+        if self._level_id not in _get_intro_levels():
+            return
         
-        if dialog_path.exists():
-            try:
-                sequence = dialog_manager.load_sequence_from_file(
-                    f"{self._level_id}_intro",
-                    dialog_path
-                )
-                self._dialog_overlay.set_sequence(sequence)
-            except Exception:
-                pass  # Silently ignore dialog errors
+        dialog_manager = get_dialog_manager()
+        dialog_path = Path(AssetPaths.GAME_DIALOGS) / f"{self._level_id}{_INTRO_SUFFIX}"
+        try:
+            sequence = dialog_manager.load_sequence_from_file(
+                f"{self._level_id}_intro",
+                dialog_path
+            )
+            self._dialog_overlay.set_sequence(sequence)
+        except Exception:
+            pass  # Silently ignore dialog errors
     
     def _show_dialog(self, dialog_id: str) -> None:
         """Show in-game dialog."""
@@ -369,30 +443,46 @@ class GameScene(BaseScene):
     
     def _save_game(self) -> None:
         """Save current game state."""
-        save_data = f"{int(self._player.position.x)} {int(self._player.position.y)} {self._player.health}"
-        
-        try:
-            with open(SAVE_FILE, 'w') as f:
-                f.write(save_data)
-        except IOError:
-            pass  # Silently ignore save errors
+        save_data = struct.pack(
+            SAVE_HEADER_FORMAT,
+            SAVE_FILE_MAGIC,
+            self._player.position.x,
+            self._player.position.y,
+            self._player.health
+        ) + self._level_id.encode('utf-8')
+        
+        # Disk write happens off the game loop
+        write_save(save_data)
     
     def _render_pause_overlay(self) -> None:
         """Render pause screen overlay."""
+        screen = self.screen
+        if self._screen_size != self._pause_size:
+            self._build_pause_overlay(self._screen_size)
+        screen.blits(self._pause_blits, doreturn=False)
+    
+    def _build_pause_overlay(self, size: Tuple[int, int]) -> None:
+        """Pre-render pause dimmer and text for the given screen size."""
+        width, height = size
+        
         # Darken screen
-        overlay = pg.Surface(self.screen.get_size())
+        overlay = pg.Surface(size).convert()
         overlay.set_alpha(128)
         overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Draw pause text
-        font = pg.font.Font(None, 72)
-        text = font.render("PAUSED", True, (255, 255, 255))
-        text_rect = text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
-        self.screen.blit(text, text_rect)
-        
-        # Draw instructions
-        instruction_font = pg.font.Font(None, 36)
-        instruction = instruction_font.render("Press P to resume", True, (200, 200, 200))
-        instruction_rect = instruction.get_rect(center=(self.screen.get_width() // 2, text_rect.bottom + 40))
-        self.screen.blit(instruction, instruction_rect)
\ No newline at end of file
+        
+        # Pause text
+        text = get_font(72).render("PAUSED", True, (255, 255, 255)).convert_alpha()
+        text_rect = text.get_rect(center=(width // 2, height // 2))
+        
+        # Instructions
+        instruction = get_font(36).render(
+            "Press P to resume", True, (200, 200, 200)
+        ).convert_alpha()
+        instruction_rect = instruction.get_rect(center=(width // 2, text_rect.bottom + 40))
+        
+        self._pause_blits = [
+            (overlay, overlay.get_rect()),
+            (text, text_rect),
+            (instruction, instruction_rect),
+        ]
+        self._pause_size = size
\ No newline at end of file
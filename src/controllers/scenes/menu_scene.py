@@ -2,18 +2,20 @@
 from __future__ import annotations
 
 from typing import Optional
-from pathlib import Path
 import pygame as pg
 
 from src.controllers.base.scene import BaseScene
 from src.views.renderers.menu_renderer import MenuRenderer, MenuItem
 from src.models.config import Config
-from src.core.constants import SAVE_FILE
+from src.models.save_data import save_exists
 
 
 class MenuScene(BaseScene):
     """Main menu scene with background and music."""
     
+    CATEGORY = "menu"
+    EVENT_FILTER = (pg.QUIT, pg.KEYDOWN, pg.MOUSEBUTTONDOWN)
+    
     def __init__(self, config: Config) -> None:
         """Initialize menu scene."""
         super().__init__(config)
@@ -29,7 +31,7 @@ class MenuScene(BaseScene):
     
     def handle_events(self) -> Optional[str]:
         """Process menu input events."""
-        for event in pg.event.get():
+        for event in self._poll_events():
             # Handle common events
             action = self._handle_common_events(event)
             if action:
@@ -66,7 +68,7 @@ class MenuScene(BaseScene):
         super().on_enter()
         
         # Update screen reference
-        self._renderer.update_screen_size(self.screen.get_width(), self.screen.get_height())
+        self._renderer.update_screen_size(*self.screen_size)
         
         # Check if save file exists and update Continue button
         self._update_continue_availability()
@@ -88,11 +90,10 @@ class MenuScene(BaseScene):
     
     def _update_continue_availability(self) -> None:
         """Check if continue should be enabled."""
-        save_path = Path(SAVE_FILE)
-        can_continue = save_path.exists()
+        can_continue = save_exists()
         
         # Update continue button state
-        items = self._renderer._items
+        items = self._renderer.items
         for item in items:
             if item.action == "continue":
                 item.enabled = can_continue
@@ -13,6 +13,9 @@ from src.core.constants import ALLOWED_FPS_VALUES, VOLUME_STEP
 class SettingsScene(BaseScene):
     """Settings menu scene for configuring game options."""
     
+    CATEGORY = "settings"
+    EVENT_FILTER = (pg.QUIT, pg.KEYDOWN, pg.MOUSEBUTTONDOWN)
+    
     def __init__(self, config: Config) -> None:
         """Initialize settings scene."""
         super().__init__(config)
@@ -29,7 +32,7 @@ class SettingsScene(BaseScene):
     
     def handle_events(self) -> Optional[str]:
         """Process settings input events."""
-        for event in pg.event.get():
+        for event in self._poll_events():
             # Handle common events
             action = self._handle_common_events(event)
             if action:
@@ -63,8 +66,8 @@ class SettingsScene(BaseScene):
     
     def update(self, delta_time: float) -> None:
         """Update settings state."""
-        # Update item values from config
-        self._update_item_values()
+        # Item values are refreshed only when the config changes
+        pass
     
     def render(self) -> None:
         """Render settings scene."""
@@ -75,7 +78,7 @@ class SettingsScene(BaseScene):
         super().on_enter()
         
         # Update screen reference
-        self._renderer.update_screen_size(self.screen.get_width(), self.screen.get_height())
+        self._renderer.update_screen_size(*self.screen_size)
         
         # Update item values
         self._update_item_values()
@@ -113,16 +116,19 @@ class SettingsScene(BaseScene):
     
     def _update_item_values(self) -> None:
         """Update item values from configuration."""
-        for item in self._renderer._items:
+        key_bindings = self.config.key_bindings
+        display = self.config.display
+        
+        for item in self._renderer.items:
             if item.setting_type == SettingType.KEY_BINDING:
                 # Get key binding value
-                item.value = getattr(self.config.key_bindings, item.identifier, 0)
+                item.value = getattr(key_bindings, item.identifier, 0)
             
             elif item.identifier == "vsync":
-                item.value = self.config.display.vsync
+                item.value = display.vsync
             
             elif item.identifier == "fps":
-                item.value = self.config.display.fps_limit
+                item.value = display.fps_limit
             
             elif item.identifier == "volume":
                 item.value = self.config.audio.music_volume
@@ -138,6 +144,7 @@ class SettingsScene(BaseScene):
         elif item.setting_type == SettingType.TOGGLE:
             if item.identifier == "vsync":
                 self.config.toggle_vsync()
+                self.invalidate_screen()
         
         elif item.setting_type == SettingType.SLIDER:
             if item.identifier == "fps" and not self.config.display.vsync:
@@ -152,7 +159,13 @@ class SettingsScene(BaseScene):
         elif item.setting_type == SettingType.ACTION:
             if item.identifier == "back":
                 self.transition_to("menu")
+        
+        # Reflect any config change in the displayed values
+        self._update_item_values()
     
     def _apply_key_binding(self, identifier: str, key: int) -> None:
         """Apply new key binding."""
-        self.config.update_key_binding(identifier, key)
\ No newline at end of file
+        self.config.update_key_binding(identifier, key)
+        
+        # Rebinding may have cleared a duplicate on another action
+        self._update_item_values()
\ No newline at end of file
@@ -1,9 +1,8 @@
 """Centralized cache management system for the game."""
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, Tuple, List, Set
-from collections import OrderedDict
-from weakref import WeakValueDictionary
+from typing import Dict, Any, Iterator, Optional, Tuple, List, Set
+import heapq
 import time
 import gc
 import pygame as pg
@@ -18,53 +17,62 @@ class CachePolicy:
     TTL = "ttl"  # Time To Live
 
 
-class CacheEntry:
-    """Single cache entry with metadata."""
-    
-    def __init__(self, key: Any, value: Any, ttl: Optional[float] = None):
-        self.key = key
-        self.value = value
-        self.created_at = time.time()
-        self.last_accessed = time.time()
-        self.access_count = 0
-        self.ttl = ttl
-        self.size = self._estimate_size(value)
-    
-    def access(self) -> Any:
-        """Access the cached value and update metadata."""
-        self.last_accessed = time.time()
-        self.access_count += 1
-        return self.value
-    
-    def is_expired(self) -> bool:
-        """Check if entry has expired."""
-        if self.ttl is None:
-            return False
-        return time.time() - self.created_at > self.ttl
-    
-    def _estimate_size(self, value: Any) -> int:
-        """Estimate memory size of value in bytes."""
-        if isinstance(value, pg.Surface):
-            return value.get_width() * value.get_height() * 4  # RGBA
-        elif isinstance(value, pg.sprite.Group):
-            return len(value) * 64  # Rough estimate per sprite
-        elif isinstance(value, (list, tuple)):
-            return sum(self._estimate_size(item) for item in value)
-        elif isinstance(value, dict):
-            return sum(self._estimate_size(k) + self._estimate_size(v) 
-                      for k, v in value.items())
+# Cache entries are packed tuples rather than objects:
+# (value, size, created_at, last_accessed, access_count, ttl)
+CacheRecord = Tuple[Any, int, float, float, int, Optional[float]]
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate memory size of value in bytes."""
+    # Surfaces are by far the most common cached value
+    if type(value) is pg.Surface:
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    
+    # Walk containers with an explicit stack instead of recursing
+    total = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, pg.Surface):
+            total += item.get_width() * item.get_height() * item.get_bytesize()
+        elif isinstance(item, pg.sprite.Group):
+            total += len(item) * 64  # Rough estimate per sprite
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
         else:
-            return 64  # Default size estimate
+            total += 64  # Default size estimate
+    return total
 
 
 class Cache:
-    """Generic cache with configurable policy and limits."""
+    """
+    Generic cache with configurable policy and limits.
+    
+    Constructing a Cache returns the subclass for the requested policy, so
+    the per-access paths never compare policy strings.
+    """
+    
+    def __new__(
+        cls,
+        name: str,
+        max_size: int = 100,
+        max_memory: Optional[int] = 100 * 1024 * 1024,
+        policy: str = CachePolicy.LRU,
+        *args: Any,
+        **kwargs: Any
+    ) -> Cache:
+        if cls is Cache:
+            cls = _POLICY_CACHES.get(policy, _FIFOCache)
+        return super().__new__(cls)
     
     def __init__(
         self,
         name: str,
         max_size: int = 100,
-        max_memory: int = 100 * 1024 * 1024,  # 100MB default
+        max_memory: Optional[int] = 100 * 1024 * 1024,  # 100MB default
         policy: str = CachePolicy.LRU,
         ttl: Optional[float] = None
     ):
@@ -73,11 +81,23 @@ class Cache:
         self.max_memory = max_memory
         self.policy = policy
         self.default_ttl = ttl
+        # Without a memory limit sizes aren't estimated and count as zero,
+        # leaving max_size as the only bound
+        self._track_memory = max_memory is not None
         
-        self._entries: OrderedDict[Any, CacheEntry] = OrderedDict()
+        self._entries: Dict[Any, CacheRecord] = {}  # Insertion ordered, oldest first
         self._total_memory = 0
         self._hits = 0
         self._misses = 0
+        
+        # Frame timestamp from the manager's tick; entries read no clock
+        self._now = time.monotonic()
+        
+        # (expires_at, insertion number, key) for entries with a TTL. Items
+        # of removed or replaced entries stay until they surface and are
+        # skipped; the insertion number keeps keys out of comparisons.
+        self._ttl_heap: List[Tuple[float, int, Any]] = []
+        self._ttl_counter = 0
     
     def get(self, key: Any, default: Any = None) -> Any:
         """Get value from cache."""
@@ -87,51 +107,72 @@ class Cache:
             self._misses += 1
             return default
         
-        if entry.is_expired():
+        value, size, created_at, _, access_count, ttl = entry
+        now = self._now
+        if ttl is not None and now - created_at > ttl:
             self.remove(key)
             self._misses += 1
             return default
         
         self._hits += 1
-        value = entry.access()
-        
-        # Move to end for LRU
-        if self.policy == CachePolicy.LRU:
-            self._entries.move_to_end(key)
+        self._on_hit(key, (value, size, created_at, now, access_count + 1, ttl))
         
         return value
     
     def put(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
         """Put value in cache."""
-        # Remove old entry if exists
-        if key in self._entries:
-            self.remove(key)
-        
-        # Create new entry
-        entry = CacheEntry(key, value, ttl or self.default_ttl)
+        existing = self._entries.get(key)
+        size = _estimate_size(value) if self._track_memory else 0
+        now = self._now
+        ttl = ttl or self.default_ttl
         
-        # Check if we need to evict
-        self._evict_if_needed(entry.size)
+        if existing is not None and size <= existing[1]:
+            # Update in place: the entry count is unchanged and memory can
+            # only shrink, so there is nothing to evict
+            self._total_memory += size - existing[1]
+            self._on_update(key, (value, size, now, now, existing[4], ttl))
+        else:
+            if existing is not None:
+                self.remove(key)
+            
+            # Check if we need to evict
+            self._evict_if_needed(size)
+            
+            # Add entry
+            self._entries[key] = (value, size, now, now, 0, ttl)
+            self._total_memory += size
+            self._on_insert(key)
         
-        # Add entry
-        self._entries[key] = entry
-        self._total_memory += entry.size
+        if ttl is not None:
+            self._ttl_counter += 1
+            heapq.heappush(self._ttl_heap, (now + ttl, self._ttl_counter, key))
     
     def remove(self, key: Any) -> bool:
         """Remove entry from cache."""
         entry = self._entries.pop(key, None)
         if entry:
-            self._total_memory -= entry.size
+            self._total_memory -= entry[1]
+            self._on_remove(key, entry)
             return True
         return False
     
     def clear(self) -> None:
         """Clear all entries."""
         self._entries.clear()
+        self._ttl_heap.clear()
         self._total_memory = 0
         self._hits = 0
         self._misses = 0
     
+    def tick(self, now: float) -> None:
+        """
+        Set the timestamp used for entry ages until the next tick.
+        
+        Args:
+            now: Current time.monotonic() value
+        """
+        self._now = now
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         total_requests = self._hits + self._misses
@@ -147,125 +188,192 @@ class Cache:
             "policy": self.policy
         }
     
+    def _on_hit(self, key: Any, entry: CacheRecord) -> None:
+        """Store an entry's updated record after a hit; keeps its slot."""
+        self._entries[key] = entry
+    
+    def _on_update(self, key: Any, entry: CacheRecord) -> None:
+        """Store a replaced entry's record; keeps its slot and access count."""
+        self._entries[key] = entry
+    
+    def _on_insert(self, key: Any) -> None:
+        """Hook for policy bookkeeping after a new entry is stored."""
+    
+    def _on_remove(self, key: Any, entry: CacheRecord) -> None:
+        """Hook for policy bookkeeping after an entry is dropped."""
+    
+    def _pick_victim(self) -> Any:
+        """Get the key to evict next; the cache must not be empty."""
+        return next(iter(self._entries))
+    
+    def _eviction_order(self) -> Iterator[Any]:
+        """Yield keys from first to last to evict under the cache policy."""
+        return iter(self._entries)
+    
     def _evict_if_needed(self, new_size: int) -> None:
         """Evict entries if cache limits exceeded."""
-        # Evict expired entries first
-        self._evict_expired()
+        # Evict expired entries first; most caches never hold a TTL entry
+        if self._ttl_heap:
+            self._evict_expired(self._now)
         
-        # Evict by size limit
-        while len(self._entries) >= self.max_size:
-            self._evict_one()
+        # Room for one more entry within both the size and memory limits
+        excess_count = len(self._entries) + 1 - self.max_size
+        excess_memory = (
+            self._total_memory + new_size - self.max_memory if self._track_memory else 0
+        )
+        if excess_count <= 0 and excess_memory <= 0:
+            return
         
-        # Evict by memory limit
-        while self._total_memory + new_size > self.max_memory:
-            if not self._evict_one():
+        # Pick the whole batch in one walk, then remove it
+        victims = []
+        for key in self._eviction_order():
+            if excess_count <= 0 and excess_memory <= 0:
                 break
-    
-    def _evict_expired(self) -> None:
-        """Remove all expired entries."""
-        expired_keys = [
-            key for key, entry in self._entries.items()
-            if entry.is_expired()
-        ]
-        for key in expired_keys:
+            victims.append(key)
+            excess_count -= 1
+            excess_memory -= self._entries[key][1]
+        for key in victims:
             self.remove(key)
     
+    def _evict_expired(self, now: float) -> None:
+        """Remove all entries expired at the given time."""
+        heap = self._ttl_heap
+        while heap and heap[0][0] < now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # Skip items left behind by a removed or replaced entry
+            if entry is not None and entry[5] is not None and entry[2] + entry[5] == expires_at:
+                self.remove(key)
+    
     def _evict_one(self) -> bool:
         """Evict one entry based on policy."""
         if not self._entries:
             return False
+        return self.remove(self._pick_victim())
+
+
+class _FIFOCache(Cache):
+    """Evicts the oldest entry; hits leave the order untouched."""
+
+
+class _LRUCache(Cache):
+    """Evicts the least recently used entry."""
+    
+    def _on_hit(self, key: Any, entry: CacheRecord) -> None:
+        """Move the hit entry to the end by reinserting it."""
+        # The record is rewritten on every hit anyway, so a plain del and
+        # store is cheaper than d[k] = d.pop(k) followed by the update
+        entries = self._entries
+        del entries[key]
+        entries[key] = entry
+    
+    # A replaced value counts as a use
+    _on_update = _on_hit
+
+
+class _LFUCache(Cache):
+    """Evicts the least frequently used entry, oldest first on ties."""
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
         
-        if self.policy == CachePolicy.LRU:
-            # Remove least recently used (first item)
-            key = next(iter(self._entries))
-        elif self.policy == CachePolicy.LFU:
-            # Remove least frequently used
-            key = min(self._entries.keys(), 
-                     key=lambda k: self._entries[k].access_count)
-        elif self.policy == CachePolicy.FIFO:
-            # Remove oldest (first item)
-            key = next(iter(self._entries))
-        else:  # TTL or default
-            # Remove oldest
-            key = next(iter(self._entries))
-        
-        return self.remove(key)
+        # Keys grouped by access count, oldest first within a count, and a
+        # cursor at or below the lowest non-empty count
+        self._freq_buckets: Dict[int, Dict[Any, None]] = {}
+        self._min_freq = 0
+    
+    def clear(self) -> None:
+        """Clear all entries."""
+        super().clear()
+        self._freq_buckets.clear()
+        self._min_freq = 0
+    
+    def _on_hit(self, key: Any, entry: CacheRecord) -> None:
+        """Store the record and move its key to the next count's bucket."""
+        self._entries[key] = entry
+        new_count = entry[4]
+        old_count = new_count - 1
+        bucket = self._freq_buckets[old_count]
+        del bucket[key]
+        if not bucket:
+            del self._freq_buckets[old_count]
+            if self._min_freq == old_count:
+                self._min_freq = new_count
+        self._freq_buckets.setdefault(new_count, {})[key] = None
+    
+    def _on_insert(self, key: Any) -> None:
+        """Start a new key in the zero-count bucket."""
+        self._freq_buckets.setdefault(0, {})[key] = None
+        self._min_freq = 0
+    
+    def _on_remove(self, key: Any, entry: CacheRecord) -> None:
+        """Drop a key from its count's bucket."""
+        access_count = entry[4]
+        bucket = self._freq_buckets[access_count]
+        del bucket[key]
+        if not bucket:
+            del self._freq_buckets[access_count]
+    
+    def _pick_victim(self) -> Any:
+        """Get the oldest key with the lowest access count."""
+        # Removals can leave the cursor below the lowest count; catch it up
+        while self._min_freq not in self._freq_buckets:
+            self._min_freq += 1
+        return next(iter(self._freq_buckets[self._min_freq]))
+    
+    def _eviction_order(self) -> Iterator[Any]:
+        """Yield keys by ascending access count, oldest first within a count."""
+        for count in sorted(self._freq_buckets):
+            yield from self._freq_buckets[count]
+
+
+# Cache class per policy; TTL caches evict oldest first like FIFO
+_POLICY_CACHES: Dict[str, type] = {
+    CachePolicy.LRU: _LRUCache,
+    CachePolicy.LFU: _LFUCache,
+    CachePolicy.FIFO: _FIFOCache,
+    CachePolicy.TTL: _FIFOCache,
+}
 
 
 class CacheManager:
     """Centralized cache manager for the entire game."""
     
-    _instance: Optional[CacheManager] = None
-    
-    def __new__(cls) -> CacheManager:
-        """Singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
         """Initialize cache manager."""
-        if hasattr(self, '_initialized'):
-            return
-        
-        self._initialized = True
         self._caches: Dict[str, Cache] = {}
         
         # Create default caches
         self._create_default_caches()
         
         # Memory monitoring
-        self._last_gc_time = time.time()
+        self._tick_time = time.monotonic()
+        self._last_gc_time = self._tick_time
         self._gc_interval = 60.0  # Run GC every minute
     
     def _create_default_caches(self) -> None:
-        """Create default game caches."""
-        # Tile rendering cache
-        self.create_cache(
-            "tile_surfaces",
-            max_size=200,
-            max_memory=50 * 1024 * 1024,  # 50MB
-            policy=CachePolicy.LRU
-        )
-        
+        """Create default game caches, also bound as attributes for direct access."""
         # Animation frame cache
-        self.create_cache(
+        self.animation_frames = self.create_cache(
             "animation_frames",
             max_size=100,
             max_memory=30 * 1024 * 1024,  # 30MB
             policy=CachePolicy.LFU
         )
         
-        # Collision groups cache
-        self.create_cache(
-            "collision_groups",
-            max_size=10,
-            max_memory=10 * 1024 * 1024,  # 10MB
-            policy=CachePolicy.LRU,
-            ttl=5.0  # Expire after 5 seconds
-        )
-        
         # Level data cache
-        self.create_cache(
+        self.level_data = self.create_cache(
             "level_data",
             max_size=5,
-            max_memory=20 * 1024 * 1024,  # 20MB
+            max_memory=None,  # Bounded by entry count
             policy=CachePolicy.LRU
         )
-        
-        # Sound effects cache
-        self.create_cache(
-            "sounds",
-            max_size=50,
-            max_memory=20 * 1024 * 1024,  # 20MB
-            policy=CachePolicy.LFU
-        )
     
     def create_cache(
         self,
         name: str,
         max_size: int = 100,
-        max_memory: int = 100 * 1024 * 1024,
+        max_memory: Optional[int] = 100 * 1024 * 1024,
         policy: str = CachePolicy.LRU,
         ttl: Optional[float] = None
     ) -> Cache:
@@ -317,9 +425,26 @@ class CacheManager:
             }
         }
     
+    def format_stats(self) -> str:
+        """Format statistics for all caches as a printable report."""
+        stats = self.get_stats()
+        parts = [f"\nCache Statistics:\nTotal Memory: {stats['total_memory'] / (1024 * 1024):.2f} MB\n"]
+        for cache_name, cache_stats in stats['caches'].items():
+            parts.append(
+                f"\n{cache_name}:\n"
+                f"  Size: {cache_stats['size']} items\n"
+                f"  Memory: {cache_stats['memory'] / (1024 * 1024):.2f} MB\n"
+                f"  Hit Rate: {cache_stats['hit_rate']:.2%}\n"
+            )
+        return "".join(parts)
+    
     def update(self) -> None:
         """Update cache manager (garbage collection, etc)."""
-        current_time = time.time()
+        # One clock read per frame, shared by every cache
+        current_time = time.monotonic()
+        self._tick_time = current_time
+        for cache in self._caches.values():
+            cache.tick(current_time)
         
         # Periodic garbage collection
         if current_time - self._last_gc_time > self._gc_interval:
@@ -330,7 +455,7 @@ class CacheManager:
         """Run garbage collection and cache cleanup."""
         # Clean up expired entries in all caches
         for cache in self._caches.values():
-            cache._evict_expired()
+            cache._evict_expired(self._tick_time)
         
         # Force Python garbage collection if memory usage is high
         total_memory = self.get_total_memory()
@@ -343,7 +468,13 @@ class CacheManager:
         self._caches.clear()
 
 
-# Global instance getter
+# Global instance, created on first request
+_CACHE_MANAGER: Optional[CacheManager] = None
+
+
 def get_cache_manager() -> CacheManager:
     """Get the global cache manager instance."""
-    return CacheManager()
\ No newline at end of file
+    global _CACHE_MANAGER
+    if _CACHE_MANAGER is None:
+        _CACHE_MANAGER = CacheManager()
+    return _CACHE_MANAGER
\ No newline at end of file
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Final
 
 
@@ -14,6 +15,8 @@ MIN_WINDOW_HEIGHT: Final[int] = 540
 
 # Tile and world constants
 TILE_SIZE: Final[int] = 64
+LEVEL_CHUNK_TILES: Final[int] = 16  # Tiles per side of a cached render chunk
+LEVEL_CHUNK_MARGIN: Final[int] = 1  # Chunks kept cached around the visible ones
 DEFAULT_MAP_WIDTH_TILES: Final[int] = 100
 DEFAULT_MAP_HEIGHT_TILES: Final[int] = 100
 
@@ -35,6 +38,7 @@ HUD_PADDING: Final[int] = 50
 HUD_ELEMENT_MARGIN: Final[int] = 10
 DIALOG_TEXT_BOX_HEIGHT_RATIO: Final[float] = 0.30
 DIALOG_PADDING: Final[int] = 40
+DIALOG_IDLE_TIMEOUT_MS: Final[int] = 33  # Max input wait while dialog is idle (~30 FPS ambient redraw)
 
 # Visual constants
 BACKGROUND_COLOR: Final[tuple[int, int, int]] = (50, 50, 70)
@@ -53,6 +57,13 @@ VOLUME_STEP: Final[float] = 0.1
 CONFIG_FILE: Final[str] = "config.json"
 SAVE_FILE: Final[str] = "savegame.dat"
 
+# Save file layout: magic, x, y, health, followed by UTF-8 level ID
+SAVE_FILE_MAGIC: Final[bytes] = b"FKSV"
+SAVE_HEADER_FORMAT: Final[str] = "<4sffI"
+
+# Environment variable enabling cache statistics output on exit
+CACHE_STATS_ENV_VAR: Final[str] = "LVL_PG_CACHE_STATS"
+
 # FPS options
 ALLOWED_FPS_VALUES: Final[list[int]] = [30, 60, 90, 120, 144, 165, 180, 200, 240]
 
@@ -95,8 +106,8 @@ class PlayerConstants:
     BLOCK_DAMAGE_REDUCTION: float = 0.5
     BLOCK_MOVEMENT_MULTIPLIER: float = 0.2
     
-    # Animation frame rates
-    ANIMATION_FPS = {
+    # Animation frame rates (read-only view, shared rather than copied)
+    ANIMATION_FPS = MappingProxyType({
         "idle": 7,
         "walk": 8,
         "run": 8,
@@ -107,7 +118,7 @@ class PlayerConstants:
         "defend": 1,
         "hurt": 4,
         "death": 12,
-    }
+    })
 
 
 @dataclass(frozen=True)
@@ -6,7 +6,6 @@ import pygame as pg
 
 from src.core.interfaces import IAnimationState
 from src.core.exceptions import AnimationError
-from src.core.cache_manager import get_cache_manager
 
 
 class Animation(IAnimationState):
@@ -16,7 +15,8 @@ class Animation(IAnimationState):
         self,
         frames: List[pg.Surface],
         fps: int,
-        loop: bool = True
+        loop: bool = True,
+        frames_flipped_x: Optional[List[pg.Surface]] = None
     ) -> None:
         """
         Initialize animation sequence.
@@ -25,6 +25,7 @@ class Animation(IAnimationState):
             frames: List of animation frames
             fps: Frames per second for playback
             loop: Whether animation should loop
+            frames_flipped_x: Already mirrored copies of frames, if available
             
         Raises:
             AnimationError: If no frames provided or invalid FPS
@@ -36,12 +37,17 @@ class Animation(IAnimationState):
             raise AnimationError("FPS must be positive")
         
         self._frames = frames
+        # Mirrored copies made once so facing left never flips at runtime
+        if frames_flipped_x is None:
+            frames_flipped_x = [pg.transform.flip(frame, True, False) for frame in frames]
+        self._frames_flipped_x = frames_flipped_x
         self._fps = fps
         self._loop = loop
         
         self._current_frame = 0
-        self._elapsed_time = 0.0
-        self._frame_duration = 1.0 / fps
+        # Integer microseconds keep frame timing free of float drift
+        self._elapsed_us = 0
+        self._frame_duration_us = 1_000_000 // fps
         self._is_playing = False
         self._is_finished = False
     
@@ -60,15 +66,29 @@ class Animation(IAnimationState):
         """Get current frame index."""
         return self._current_frame
     
+    @property
+    def current_surface(self) -> pg.Surface:
+        """Get current frame surface without advancing the animation."""
+        return self._frames[self._current_frame]
+    
     @property
     def frame_count(self) -> int:
         """Get total number of frames."""
         return len(self._frames)
     
+    def copy(self) -> Animation:
+        """
+        Create an animation sharing this one's frames with its own playback state.
+        
+        Returns:
+            New, stopped animation at the first frame
+        """
+        return Animation(self._frames, self._fps, self._loop, self._frames_flipped_x)
+    
     def start(self) -> None:
         """Start or restart the animation."""
         self._current_frame = 0
-        self._elapsed_time = 0.0
+        self._elapsed_us = 0
         self._is_playing = True
         self._is_finished = False
     
@@ -79,7 +99,7 @@ class Animation(IAnimationState):
     def reset(self) -> None:
         """Reset animation to first frame."""
         self._current_frame = 0
-        self._elapsed_time = 0.0
+        self._elapsed_us = 0
         self._is_finished = False
     
     def update(self, delta_time: float) -> pg.Surface:
@@ -93,15 +113,28 @@ class Animation(IAnimationState):
             Current animation frame
         """
         if self._is_playing and not self._is_finished:
-            self._elapsed_time += delta_time
+            self._elapsed_us += int(delta_time * 1_000_000)
             
-            # Check if we need to advance frame
-            while self._elapsed_time >= self._frame_duration:
-                self._elapsed_time -= self._frame_duration
-                self._advance_frame()
+            # Advance every whole frame that elapsed in one step
+            steps, self._elapsed_us = divmod(self._elapsed_us, self._frame_duration_us)
+            if steps:
+                self._advance_frames(steps)
         
         return self._frames[self._current_frame]
     
+    def get_current_surface(self, flip_x: bool = False) -> pg.Surface:
+        """
+        Get current frame, optionally mirrored horizontally.
+        
+        Args:
+            flip_x: Whether to return the horizontally flipped frame
+            
+        Returns:
+            Current frame surface
+        """
+        frames = self._frames_flipped_x if flip_x else self._frames
+        return frames[self._current_frame]
+    
     def get_frame(self, index: int) -> pg.Surface:
         """
         Get specific frame by index.
@@ -133,19 +166,21 @@ class Animation(IAnimationState):
             raise AnimationError("FPS must be positive")
         
         self._fps = fps
-        self._frame_duration = 1.0 / fps
+        self._frame_duration_us = 1_000_000 // fps
     
-    def _advance_frame(self) -> None:
-        """Advance to next frame in sequence."""
-        self._current_frame += 1
+    def _advance_frames(self, steps: int) -> None:
+        """Advance by a number of frames, wrapping or stopping at the end."""
+        frame_count = len(self._frames)
+        next_frame = self._current_frame + steps
         
-        if self._current_frame >= len(self._frames):
-            if self._loop:
-                self._current_frame = 0
-            else:
-                self._current_frame = len(self._frames) - 1
-                self._is_finished = True
-                self._is_playing = False
+        if next_frame < frame_count:
+            self._current_frame = next_frame
+        elif self._loop:
+            self._current_frame = next_frame % frame_count
+        else:
+            self._current_frame = frame_count - 1
+            self._is_finished = True
+            self._is_playing = False
 
 
 class AnimationSet:
@@ -168,9 +203,6 @@ class AnimationSet:
         self._current_state = next(iter(animations.keys()))
         self._current_animation = animations[self._current_state]
         self._current_animation.start()
-        
-        # Use centralized cache manager
-        self._cache_manager = get_cache_manager()
     
     @property
     def current_state(self) -> any:
@@ -219,29 +251,16 @@ class AnimationSet:
         Returns:
             Current frame surface (possibly flipped)
         """
-        frame = self._current_animation.update(0)  # Get current frame without updating
-        
         if not flip_x and not flip_y:
-            return frame
-        
-        # Create cache key
-        cache_key = (
-            id(self),  # Unique ID for this animation set
-            self._current_state,
-            self._current_animation.current_frame_index,
-            flip_x,
-            flip_y
-        )
+            return self._current_animation.current_surface
         
-        # Try to get from cache
-        cached = self._cache_manager.get("animation_frames", cache_key)
+        frame = self._current_animation.get_current_surface(flip_x)
         
-        if cached is None:
-            # Create flipped frame and cache it
-            cached = pg.transform.flip(frame, flip_x, flip_y)
-            self._cache_manager.put("animation_frames", cache_key, cached)
+        # Vertical flips are not precomputed; nothing in the game uses them
+        if flip_y:
+            frame = pg.transform.flip(frame, False, True)
         
-        return cached
+        return frame
     
     def is_finished(self) -> bool:
         """Check if current animation has finished."""
@@ -275,4 +294,4 @@ class AnimationSet:
     
     def has_state(self, state: any) -> bool:
         """Check if animation set contains given state."""
-        return state in self._animations
\ No newline at end of file
+        return state in self._animations
@@ -3,10 +3,15 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field, asdict
+from typing import ClassVar, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field, fields
 import pygame as pg
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the standard library works the same
+    orjson = None
+
 from src.core.constants import (
     CONFIG_FILE, DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT,
     MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT, DEFAULT_MUSIC_VOLUME,
@@ -15,6 +20,19 @@ from src.core.constants import (
 from src.core.exceptions import ConfigError
 
 
+# FPS limits for validation and the value each one cycles to
+_FPS_SET = frozenset(ALLOWED_FPS_VALUES)
+_FPS_NEXT = {
+    fps: ALLOWED_FPS_VALUES[(i + 1) % len(ALLOWED_FPS_VALUES)]
+    for i, fps in enumerate(ALLOWED_FPS_VALUES)
+}
+
+
+def _fields_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow dict of a flat settings dataclass, without asdict's deep copies."""
+    return {name: getattr(obj, name) for name in obj._FIELDS}
+
+
 @dataclass
 class KeyBindings:
     """Player control key bindings."""
@@ -25,9 +43,12 @@ class KeyBindings:
     sprint: int = pg.K_LSHIFT
     block: int = pg.K_f
     
+    # Field names in declaration order, set once below the class
+    _FIELDS: ClassVar[Tuple[str, ...]]
+    
     def to_dict(self) -> Dict[str, int]:
         """Convert to dictionary format."""
-        return asdict(self)
+        return _fields_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, int]) -> KeyBindings:
@@ -35,6 +56,9 @@ class KeyBindings:
         return cls(**data)
 
 
+KeyBindings._FIELDS = tuple(f.name for f in fields(KeyBindings))
+
+
 @dataclass
 class DisplaySettings:
     """Display-related settings."""
@@ -45,13 +69,16 @@ class DisplaySettings:
     window_width: int = DEFAULT_WINDOW_WIDTH
     window_height: int = DEFAULT_WINDOW_HEIGHT
     
+    # Field names in declaration order, set once below the class
+    _FIELDS: ClassVar[Tuple[str, ...]]
+    
     def __post_init__(self):
         """Validate settings after initialization."""
         self._validate()
     
     def _validate(self) -> None:
         """Validate display settings."""
-        if self.fps_limit not in ALLOWED_FPS_VALUES:
+        if self.fps_limit not in _FPS_SET:
             self.fps_limit = 60
         
         if self.window_width < MIN_WINDOW_WIDTH:
@@ -66,6 +93,9 @@ class DisplaySettings:
         return (self.window_width, self.window_height)
 
 
+DisplaySettings._FIELDS = tuple(f.name for f in fields(DisplaySettings))
+
+
 @dataclass
 class AudioSettings:
     """Audio-related settings."""
@@ -73,12 +103,39 @@ class AudioSettings:
     music_volume: float = DEFAULT_MUSIC_VOLUME
     sound_volume: float = DEFAULT_MUSIC_VOLUME
     
+    # Field names in declaration order, set once below the class
+    _FIELDS: ClassVar[Tuple[str, ...]]
+    
     def __post_init__(self):
         """Validate settings after initialization."""
         self.music_volume = max(0.0, min(1.0, self.music_volume))
         self.sound_volume = max(0.0, min(1.0, self.sound_volume))
 
 
+AudioSettings._FIELDS = tuple(f.name for f in fields(AudioSettings))
+
+# (JSON key, Config attribute) of each settings section in the config file
+_SECTIONS = (
+    ('key_bindings', '_key_bindings'),
+    ('display', '_display'),
+    ('audio', '_audio'),
+)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize configuration data to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON configuration data."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class Config:
     """Game configuration manager following single responsibility principle."""
     
@@ -89,6 +146,10 @@ class Config:
         self._display: DisplaySettings = DisplaySettings()
         self._audio: AudioSettings = AudioSettings()
         self._screen: Optional[pg.Surface] = None
+        # Incremented whenever display settings or the display itself change
+        self._display_version = 0
+        # File contents as last read or written, to skip unchanged saves
+        self._saved_bytes: Optional[bytes] = None
         self._load()
     
     # Properties for encapsulation
@@ -102,6 +163,11 @@ class Config:
         """Get display settings (read-only)."""
         return self._display
     
+    @property
+    def display_version(self) -> int:
+        """Get counter that changes on every display settings change."""
+        return self._display_version
+    
     @property
     def audio(self) -> AudioSettings:
         """Get audio settings (read-only)."""
@@ -115,19 +181,26 @@ class Config:
     # Public methods
     def update_key_binding(self, action: str, key: int) -> None:
         """Update a key binding, ensuring no duplicates."""
-        if not hasattr(self._key_bindings, action):
+        if action not in KeyBindings._FIELDS:
             raise ConfigError(f"Invalid action: {action}")
         
         # Remove duplicate bindings
-        for attr_name in vars(self._key_bindings):
-            if getattr(self._key_bindings, attr_name) == key:
-                setattr(self._key_bindings, attr_name, 0)
+        for name in KeyBindings._FIELDS:
+            if getattr(self._key_bindings, name) == key:
+                setattr(self._key_bindings, name, 0)
         
         setattr(self._key_bindings, action, key)
     
     def toggle_vsync(self) -> None:
         """Toggle vsync setting."""
         self._display.vsync = not self._display.vsync
+        self._display_version += 1
+        self._recreate_display()
+    
+    def toggle_fullscreen(self) -> None:
+        """Toggle fullscreen mode."""
+        self._display.fullscreen = not self._display.fullscreen
+        self._display_version += 1
         self._recreate_display()
     
     def cycle_fps_limit(self) -> None:
@@ -135,9 +208,8 @@ class Config:
         if self._display.vsync:
             return
         
-        current_index = ALLOWED_FPS_VALUES.index(self._display.fps_limit)
-        next_index = (current_index + 1) % len(ALLOWED_FPS_VALUES)
-        self._display.fps_limit = ALLOWED_FPS_VALUES[next_index]
+        self._display.fps_limit = _FPS_NEXT[self._display.fps_limit]
+        self._display_version += 1
     
     def set_music_volume(self, volume: float) -> None:
         """Set music volume."""
@@ -151,6 +223,7 @@ class Config:
     
     def create_display(self) -> pg.Surface:
         """Create or recreate the display surface."""
+        self._display_version += 1
         flags = pg.DOUBLEBUF | pg.RESIZABLE
         
         if self._display.fullscreen:
@@ -160,6 +233,8 @@ class Config:
             size = self._display.window_size
             flags |= pg.SCALED
         
+        # Plain vsync: the SCALED renderer only has an on/off vsync hint,
+        # and flip() waits for the refresh
         vsync = 1 if self._display.vsync else 0
         
         try:
@@ -184,12 +259,12 @@ class Config:
     def save(self) -> None:
         """Save configuration to file."""
         try:
-            data = self._to_dict()
-            self._config_path.write_text(
-                json.dumps(data, indent=2),
-                encoding='utf-8'
-            )
-        except (IOError, json.JSONEncodeError) as e:
+            raw = _dumps(self._to_dict())
+            if raw == self._saved_bytes:
+                return
+            self._config_path.write_bytes(raw)
+            self._saved_bytes = raw
+        except (OSError, TypeError) as e:
             raise ConfigError(f"Failed to save configuration: {e}")
     
     # Private methods
@@ -199,9 +274,10 @@ class Config:
             return
         
         try:
-            data = json.loads(self._config_path.read_text(encoding='utf-8'))
-            self._from_dict(data)
-        except (IOError, json.JSONDecodeError) as e:
+            raw = self._config_path.read_bytes()
+            self._from_dict(_loads(raw))
+            self._saved_bytes = raw
+        except (OSError, ValueError) as e:
             # Log error but continue with defaults
             print(f"Failed to load configuration: {e}")
     
@@ -212,11 +288,7 @@ class Config:
     
     def _to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            'key_bindings': self._key_bindings.to_dict(),
-            'display': asdict(self._display),
-            'audio': asdict(self._audio),
-        }
+        return {key: _fields_dict(getattr(self, attr)) for key, attr in _SECTIONS}
     
     def _from_dict(self, data: Dict[str, Any]) -> None:
         """Load configuration from dictionary."""
@@ -226,6 +298,7 @@ class Config:
         if 'display' in data:
             display_data = data.get('display', {})
             self._display = DisplaySettings(**display_data)
+            self._display_version += 1
         
         if 'audio' in data:
             audio_data = data.get('audio', {})
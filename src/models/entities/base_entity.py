@@ -2,15 +2,43 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 import pygame as pg
 
 from src.core.interfaces import IEntity
 
 
+@lru_cache(maxsize=256)
+def load_cached_image(path: str, size: Optional[Tuple[int, int]] = None) -> pg.Surface:
+    """
+    Load an image, optionally scaled, decoding each path and size only once.
+    
+    The surface is shared between all callers; copy it before drawing on it.
+    
+    Args:
+        path: Path to image file
+        size: Target size for scaling, or None to keep the original size
+        
+    Returns:
+        Converted image surface
+        
+    Raises:
+        pygame.error: If the image cannot be loaded
+    """
+    image = pg.image.load(path).convert_alpha()
+    if size is not None:
+        image = pg.transform.scale(image, size)
+    return image
+
+
 class BaseEntity(pg.sprite.Sprite, IEntity):
     """Abstract base class for all game entities."""
     
+    # Sprite instances still carry a __dict__; slots keep the attributes
+    # read every frame out of it
+    __slots__ = ('_position', '_velocity', '_image', '_rect')
+    
     def __init__(self) -> None:
         """Initialize base entity."""
         super().__init__()
@@ -78,6 +106,8 @@ class BaseEntity(pg.sprite.Sprite, IEntity):
 class StaticEntity(BaseEntity):
     """Base class for static, non-moving entities."""
     
+    __slots__ = ()
+    
     def __init__(self, x: float, y: float, image: pg.Surface) -> None:
         """Initialize static entity at given position."""
         super().__init__()
@@ -92,11 +122,14 @@ class StaticEntity(BaseEntity):
 class DynamicEntity(BaseEntity):
     """Base class for moving entities with physics."""
     
+    __slots__ = ('_acceleration', '_max_velocity')
+    
     def __init__(self) -> None:
         """Initialize dynamic entity."""
         super().__init__()
         self._acceleration = pg.math.Vector2()
-        self._max_velocity = pg.math.Vector2(float('inf'), float('inf'))
+        # Plain (x, y) tuple: only ever read, and unpacking beats Vector2 lookups
+        self._max_velocity: Tuple[float, float] = (float('inf'), float('inf'))
     
     @property
     def acceleration(self) -> pg.math.Vector2:
@@ -109,26 +142,33 @@ class DynamicEntity(BaseEntity):
         self._acceleration = value
     
     @property
-    def max_velocity(self) -> pg.math.Vector2:
+    def max_velocity(self) -> Tuple[float, float]:
         """Get maximum velocity constraints."""
         return self._max_velocity
     
     @max_velocity.setter
-    def max_velocity(self, value: pg.math.Vector2) -> None:
+    def max_velocity(self, value: Tuple[float, float]) -> None:
         """Set maximum velocity constraints."""
         self._max_velocity = value
     
     def update_physics(self, delta_time: float) -> None:
         """Update entity physics (velocity and position)."""
-        # Update velocity based on acceleration
-        self._velocity += self._acceleration * delta_time
-        
-        # Clamp velocity to maximum values
-        if abs(self._velocity.x) > abs(self._max_velocity.x):
-            self._velocity.x = self._max_velocity.x if self._velocity.x > 0 else -self._max_velocity.x
+        # Integrate and clamp on plain floats, then write each vector back
+        # in place instead of building temporary Vector2s
+        velocity = self._velocity
+        max_x, max_y = self._max_velocity
+        max_x = abs(max_x)
+        max_y = abs(max_y)
         
-        if abs(self._velocity.y) > abs(self._max_velocity.y):
-            self._velocity.y = self._max_velocity.y if self._velocity.y > 0 else -self._max_velocity.y
+        # Update velocity based on acceleration, clamped to maximum values
+        vx = velocity.x + self._acceleration.x * delta_time
+        vy = velocity.y + self._acceleration.y * delta_time
+        # Conditional expressions, not min()/max(): no builtin calls
+        vx = max_x if vx > max_x else -max_x if vx < -max_x else vx
+        vy = max_y if vy > max_y else -max_y if vy < -max_y else vy
+        velocity.update(vx, vy)
         
         # Update position based on velocity
-        self.position += self._velocity * delta_time
\ No newline at end of file
+        position = self._position
+        position.update(position.x + vx * delta_time, position.y + vy * delta_time)
+        self.position = position
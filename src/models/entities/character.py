@@ -6,13 +6,18 @@ from typing import Optional
 from pathlib import Path
 import pygame as pg
 
-from src.models.entities.base_entity import DynamicEntity
+from src.models.entities.base_entity import DynamicEntity, load_cached_image
 from src.core.exceptions import ResourceError
 
 
 class Character(DynamicEntity, ABC):
     """Base class for all game characters (player, NPCs, enemies)."""
     
+    __slots__ = (
+        '_max_health', '_health', '_is_alive', '_sprite_size', '_facing_left',
+        '_on_ground', '_invulnerable', '_invulnerable_timer', '_invulnerable_duration'
+    )
+    
     def __init__(
         self,
         x: float,
@@ -179,7 +184,7 @@ class Character(DynamicEntity, ABC):
             size: Target size for scaling
             
         Returns:
-            Scaled sprite surface
+            Scaled sprite surface, shared with other loads of the same sprite
             
         Raises:
             ResourceError: If sprite cannot be loaded
@@ -191,7 +196,6 @@ class Character(DynamicEntity, ABC):
             return surface
         
         try:
-            sprite = pg.image.load(str(path)).convert_alpha()
-            return pg.transform.scale(sprite, size)
+            return load_cached_image(str(path), tuple(size))
         except pg.error as e:
             raise ResourceError(f"Failed to load sprite {path}: {e}")
\ No newline at end of file
@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from typing import Optional
+import math
 import pygame as pg
 
-from src.models.entities.base_entity import StaticEntity
+from src.models.entities.base_entity import StaticEntity, load_cached_image
 from src.core.exceptions import EntityError
 
 
@@ -16,6 +17,11 @@ class Entity(StaticEntity):
     collectibles, obstacles, and other environmental elements.
     """
     
+    __slots__ = (
+        '_is_interactive', '_is_collectible', '_interaction_range',
+        '_render_offset_y', '_custom_data'
+    )
+    
     def __init__(
         self,
         x: float,
@@ -46,6 +52,8 @@ class Entity(StaticEntity):
         self._is_interactive = False
         self._is_collectible = False
         self._interaction_range = 50
+        # Vertical drawing offset, kept out of custom data since it changes every frame
+        self._render_offset_y = 0.0
         self._custom_data = {}
     
     @property
@@ -78,6 +86,11 @@ class Entity(StaticEntity):
         """Set interaction range."""
         self._interaction_range = max(0, value)
     
+    @property
+    def render_offset_y(self) -> float:
+        """Get vertical offset to draw the image at, relative to the rect."""
+        return self._render_offset_y
+    
     def can_interact_with(self, other_rect: pg.Rect) -> bool:
         """
         Check if another rectangle is within interaction range.
@@ -91,13 +104,14 @@ class Entity(StaticEntity):
         if not self._is_interactive:
             return False
         
-        # Create inflated rect for interaction range
-        interaction_rect = self.rect.inflate(
-            self._interaction_range * 2,
-            self._interaction_range * 2
+        # Overlap test against the rect grown by the range on every side,
+        # done inline rather than allocating an inflated Rect
+        rect = self.rect
+        reach = self._interaction_range
+        return (
+            rect.left - reach < other_rect.right and other_rect.left < rect.right + reach
+            and rect.top - reach < other_rect.bottom and other_rect.top < rect.bottom + reach
         )
-        
-        return interaction_rect.colliderect(other_rect)
     
     def interact(self) -> Optional[dict]:
         """
@@ -159,13 +173,13 @@ class Entity(StaticEntity):
             path: Path to image file
             
         Returns:
-            Loaded image surface
+            Loaded image surface, shared with other entities using the same file
             
         Raises:
             EntityError: If image cannot be loaded
         """
         try:
-            return pg.image.load(path).convert_alpha()
+            return load_cached_image(path)
         except pg.error as e:
             raise EntityError(f"Failed to load entity image {path}: {e}")
 
@@ -225,12 +239,12 @@ class CollectibleEntity(Entity):
         # Apply bobbing animation
         self._bob_offset = (
             self._bob_amplitude * 
-            pg.math.sin(self._time_alive * self._bob_speed)
+            math.sin(self._time_alive * self._bob_speed)
         )
         
         # Update visual position (not collision rect)
         # This would be used by renderer for drawing offset
-        self.set_custom_data("render_offset_y", self._bob_offset)
+        self._render_offset_y = self._bob_offset
     
     def collect(self) -> Optional[dict]:
         """
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from enum import Enum, auto
-from typing import Dict, Optional
+from typing import ClassVar, Dict, Optional
 from pathlib import Path
 import random
 import pygame as pg
@@ -44,8 +44,49 @@ class PlayerAction(Enum):
     ATTACK_HEAVY = auto()
 
 
+# State groups for per-frame checks. Tuples rather than sets: `in` matches
+# the enum members by identity, skipping Enum's Python-level __hash__
+_ATTACK_STATES = (PlayerState.ATTACK_LIGHT_1, PlayerState.ATTACK_LIGHT_2, PlayerState.ATTACK_HEAVY)
+_SWORD_SOUND_STATES = (PlayerState.ATTACK_LIGHT_1, PlayerState.ATTACK_LIGHT_2)
+# States that run to the end of their animation before anything else
+_UNINTERRUPTIBLE_STATES = _ATTACK_STATES + (PlayerState.HURT,)
+# States kept while airborne instead of switching to JUMP
+_AIRBORNE_KEPT_STATES = _UNINTERRUPTIBLE_STATES + (
+    PlayerState.JUMP, PlayerState.DEATH, PlayerState.BLOCK
+)
+_ATTACK_READY_STATES = (PlayerState.IDLE, PlayerState.WALK, PlayerState.RUN, PlayerState.JUMP)
+
+# Horizontal speed indexed by (is_sprinting << 1) | is_blocking
+_MOVE_SPEEDS = tuple(
+    BASE_MOVEMENT_SPEED * (SPRINT_MULTIPLIER if sprinting else 1.0)
+    * (PlayerConstants.BLOCK_MOVEMENT_MULTIPLIER if blocking else 1.0)
+    for sprinting in (False, True)
+    for blocking in (False, True)
+)
+
+# Movement state indexed by (on_ground << 2) | (moving << 1) | is_sprinting
+_MOVEMENT_STATES = (
+    PlayerState.JUMP, PlayerState.JUMP, PlayerState.JUMP, PlayerState.JUMP,
+    PlayerState.IDLE, PlayerState.IDLE, PlayerState.WALK, PlayerState.RUN,
+)
+
+_SWORD_STRIKE_PATH = str(Path(AssetPaths.GAME_SOUNDS) / "hero_knight" / "sword_strike_prokh.mp3")
+
+
 class Player(Character):
     """Player character with full movement and combat capabilities."""
+
+    __slots__ = (
+        '_mana', '_max_mana', '_coins', '_move_direction', '_is_sprinting',
+        '_jump_requested', '_is_blocking', '_last_right_click_time',
+        '_current_state', '_animations'
+    )
+
+    # Sounds shared by every player, loaded by the first one
+    _sounds_loaded: ClassVar[bool] = False
+    _sword_strike_sound: ClassVar[Optional[pg.mixer.Sound]] = None
+    # Magenta frame shown for missing animations, built on first use
+    _PLACEHOLDER_FRAME: ClassVar[Optional[pg.Surface]] = None
     
     def __init__(self, x: float, y: float, health: int = PlayerConstants.MAX_HEALTH) -> None:
         """Initialize player at given position."""
@@ -74,25 +115,25 @@ class Player(Character):
         self.image = self._animations.get_current_frame()
         
         # Set physics constraints
-        self.max_velocity = pg.math.Vector2(
+        self.max_velocity = (
             BASE_MOVEMENT_SPEED * SPRINT_MULTIPLIER,  # Max horizontal speed
             MAX_FALL_SPEED  # Max fall speed
         )
-
+        
         # Load sword strike sound
-        sound_path = str(Path(AssetPaths.GAME_SOUNDS) / "hero_knight" / "sword_strike_prokh.mp3")
+        Player._ensure_sounds()
+    
+    @classmethod
+    def _ensure_sounds(cls) -> None:
+        """Load the shared player sounds on first use."""
+        if cls._sounds_loaded:
+            return
+        cls._sounds_loaded = True
+        
         try:
-            # Try to get from cache first
-            cache_manager = get_cache_manager()
-            self._sword_strike_sound = cache_manager.get("sounds", sound_path)
-            
-            if self._sword_strike_sound is None:
-                self._sword_strike_sound = pg.mixer.Sound(sound_path)
-                cache_manager.put("sounds", sound_path, self._sword_strike_sound)
+            cls._sword_strike_sound = pg.mixer.Sound(_SWORD_STRIKE_PATH)
         except Exception as e:
-            print(f"Failed to load sword strike sound: {sound_path}", e)
-            self._sword_strike_sound = None
-
+            print(f"Failed to load sword strike sound: {_SWORD_STRIKE_PATH}", e)
     
     # Properties
     @property
@@ -221,61 +262,55 @@ class Player(Character):
     
     def _update_character(self, delta_time: float) -> None:
         """Update player-specific logic."""
+        # Work on the underlying vectors and flags directly; this runs every
+        # frame and each property access is a Python-level call
+        velocity = self._velocity
+        acceleration = self._acceleration
+        
         # Handle jump
-        if self._jump_requested and self.on_ground and not self._is_blocking:
-            self.velocity.y = JUMP_SPEED  # pixels per second
-            self.on_ground = False
+        if self._jump_requested and self._on_ground and not self._is_blocking:
+            velocity.y = JUMP_SPEED  # pixels per second
+            self._on_ground = False
             self._jump_requested = False
             # Trigger jump animation only if not currently attacking
-            if self._current_state not in {
-                PlayerState.ATTACK_LIGHT_1,
-                PlayerState.ATTACK_LIGHT_2,
-                PlayerState.ATTACK_HEAVY,
-            }:
+            if self._current_state not in _ATTACK_STATES:
                 self._enter_state(PlayerState.JUMP)
         
         # Apply gravity
-        if not self.on_ground:
-            self.acceleration.y = GRAVITY  # pixels per second squared
+        if not self._on_ground:
+            acceleration.y = GRAVITY  # pixels per second squared
             # If airborne and not in jump state and not attacking etc., ensure jump or falling animation
-            if self._current_state not in {
-                PlayerState.JUMP, PlayerState.ATTACK_LIGHT_1,
-                PlayerState.ATTACK_LIGHT_2, PlayerState.ATTACK_HEAVY,
-                PlayerState.HURT, PlayerState.DEATH, PlayerState.BLOCK
-            }:
+            if self._current_state not in _AIRBORNE_KEPT_STATES:
                 self._enter_state(PlayerState.JUMP)
         else:
-            self.acceleration.y = 0
-            self.velocity.y = 0
+            acceleration.y = 0
+            velocity.y = 0
         
-        # Handle horizontal movement
-        # Apply movement multiplier if blocking
-        base_speed = BASE_MOVEMENT_SPEED * (SPRINT_MULTIPLIER if self._is_sprinting else 1.0)
-        if self._is_blocking:
-            base_speed *= PlayerConstants.BLOCK_MOVEMENT_MULTIPLIER
-        speed = base_speed
-        self.velocity.x = self._move_direction * speed  # pixels per second
+        # Handle horizontal movement, slowed while blocking
+        speed = _MOVE_SPEEDS[(self._is_sprinting << 1) | self._is_blocking]
+        move_direction = self._move_direction
+        velocity.x = move_direction * speed  # pixels per second
         
         # Reset horizontal acceleration to prevent accumulation
-        self.acceleration.x = 0
+        acceleration.x = 0
         
         # Update facing direction
-        if self._move_direction < 0:
-            self.facing_left = True
-        elif self._move_direction > 0:
-            self.facing_left = False
+        if move_direction < 0:
+            self._facing_left = True
+        elif move_direction > 0:
+            self._facing_left = False
         
         # Update animation state machine
         self._update_state_machine()
         
         # Update animation
         self._animations.update(delta_time)
-        self.image = self._animations.get_current_frame(flip_x=self.facing_left)
+        self.image = self._animations.get_current_frame(flip_x=self._facing_left)
     
     # Private methods
     def _can_attack(self) -> bool:
         """Check if player can initiate an attack."""
-        return self._current_state in {PlayerState.IDLE, PlayerState.WALK, PlayerState.RUN, PlayerState.JUMP}
+        return self._current_state in _ATTACK_READY_STATES
     
     def _enter_state(self, new_state: PlayerState) -> None:
         """Transition to a new animation state."""
@@ -283,8 +318,8 @@ class Player(Character):
             return
         
         # Play sword strike sound for attack states
-        if new_state in (PlayerState.ATTACK_LIGHT_1, PlayerState.ATTACK_LIGHT_2):
-            if hasattr(self, '_sword_strike_sound') and self._sword_strike_sound:
+        if new_state in _SWORD_SOUND_STATES:
+            if self._sword_strike_sound:
                 self._sword_strike_sound.play()
         
         self._current_state = new_state
@@ -292,43 +327,38 @@ class Player(Character):
     
     def _update_state_machine(self) -> None:
         """Update animation state based on player status."""
+        state = self._current_state
+        
         # Handle non-interruptible states
-        if self._current_state in {PlayerState.ATTACK_LIGHT_1, PlayerState.ATTACK_LIGHT_2, 
-                                   PlayerState.ATTACK_HEAVY, PlayerState.HURT}:
+        if state in _UNINTERRUPTIBLE_STATES:
             if self._animations.is_finished():
-                next_state = PlayerState.JUMP if not self.on_ground else PlayerState.IDLE
-                self._enter_state(next_state)
+                self._enter_state(PlayerState.IDLE if self._on_ground else PlayerState.JUMP)
             return
         
-        if self._current_state == PlayerState.DEATH:
+        if state is PlayerState.DEATH:
             if self._animations.is_finished():
                 self.kill()
             return
         
-        if self._current_state == PlayerState.BLOCK:
+        if state is PlayerState.BLOCK:
             return
         
         # Determine movement state
-        if not self.on_ground:
-            desired_state = PlayerState.JUMP
-        elif self._move_direction != 0:
-            desired_state = PlayerState.RUN if self._is_sprinting else PlayerState.WALK
-        else:
-            desired_state = PlayerState.IDLE
-        
-        self._enter_state(desired_state)
+        self._enter_state(_MOVEMENT_STATES[
+            (self._on_ground << 2) | ((self._move_direction != 0) << 1) | self._is_sprinting
+        ])
     
     def _load_animations(self) -> AnimationSet:
         """Load all player animations with caching."""
-        cache_manager = get_cache_manager()
+        level_cache = get_cache_manager().level_data
         cache_key = "player_animations"
         
         # Try to get animations from cache
-        cached_animations = cache_manager.get("level_data", cache_key)
+        cached_animations = level_cache.get(cache_key)
         
         if cached_animations is not None:
-            # Create new AnimationSet with cached data
-            return AnimationSet(cached_animations.copy())
+            # Share the cached frames; each player gets its own playback state
+            return AnimationSet({state: anim.copy() for state, anim in cached_animations.items()})
         
         # Load animations
         base_path = Path(AssetPaths.HERO_KNIGHT)
@@ -350,10 +380,19 @@ class Player(Character):
             frames = self._load_animation_frames(base_path / folder)
             animations[state] = Animation(frames, fps, loop=loop)
         
-        # Cache the animations
-        cache_manager.put("level_data", cache_key, animations.copy())
+        # Cache the animations as templates that are never played themselves
+        level_cache.put(cache_key, animations)
         
-        return AnimationSet(animations)
+        return AnimationSet({state: anim.copy() for state, anim in animations.items()})
+    
+    @classmethod
+    def _get_placeholder(cls) -> pg.Surface:
+        """Get the shared placeholder frame, creating it on first call."""
+        if cls._PLACEHOLDER_FRAME is None:
+            placeholder = pg.Surface(PlayerConstants.SPRITE_SIZE, pg.SRCALPHA).convert_alpha()
+            placeholder.fill((255, 0, 255))
+            cls._PLACEHOLDER_FRAME = placeholder
+        return cls._PLACEHOLDER_FRAME
     
     def _load_animation_frames(self, folder_path: Path) -> list[pg.Surface]:
         """Load and scale animation frames from folder."""
@@ -361,23 +400,21 @@ class Player(Character):
         
         if not folder_path.exists():
             # Return single placeholder frame
-            placeholder = pg.Surface(PlayerConstants.SPRITE_SIZE, pg.SRCALPHA)
-            placeholder.fill((255, 0, 255))
-            return [placeholder]
+            return [self._get_placeholder()]
         
         # Load all PNG files in order
         for image_path in sorted(folder_path.glob("*.png")):
             try:
                 frame = pg.image.load(str(image_path)).convert_alpha()
-                scaled_frame = pg.transform.scale(frame, PlayerConstants.SPRITE_SIZE)
-                frames.append(scaled_frame)
+                # The shipped frames are already sprite-sized; skip the copy
+                if frame.get_size() != PlayerConstants.SPRITE_SIZE:
+                    frame = pg.transform.scale(frame, PlayerConstants.SPRITE_SIZE)
+                frames.append(frame)
             except pg.error:
                 continue
         
         # Ensure at least one frame
         if not frames:
-            placeholder = pg.Surface(PlayerConstants.SPRITE_SIZE, pg.SRCALPHA)
-            placeholder.fill((255, 0, 255))
-            frames.append(placeholder)
+            frames.append(self._get_placeholder())
         
         return frames
\ No newline at end of file
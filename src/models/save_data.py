@@ -0,0 +1,67 @@
+"""Saved game state model and save file persistence."""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Optional
+import os
+
+from src.core.constants import SAVE_FILE
+
+
+class SavedData(NamedTuple):
+    """Player state restored when continuing a saved game."""
+    
+    x: float
+    y: float
+    health: int
+    level: str = "tutorial"
+
+
+# Single worker keeps writes ordered; interpreter exit waits for it
+_SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+_pending_save: Optional[Future] = None
+
+# Whether the save file exists; None until first checked
+_save_exists: Optional[bool] = None
+
+
+def save_exists() -> bool:
+    """Check if a save file exists, hitting the disk only on first call."""
+    global _save_exists
+    if _save_exists is None:
+        _save_exists = Path(SAVE_FILE).exists()
+    return _save_exists
+
+
+def write_save(payload: bytes) -> None:
+    """
+    Write save file contents on the background worker.
+    
+    Args:
+        payload: Complete save file bytes
+    """
+    global _pending_save, _save_exists
+    _save_exists = True
+    _pending_save = _SAVE_EXECUTOR.submit(_atomic_write, SAVE_FILE, payload)
+
+
+def wait_for_save() -> None:
+    """Block until a pending background save has reached the disk."""
+    global _pending_save
+    if _pending_save is not None:
+        _pending_save.result()
+        _pending_save = None
+
+
+def _atomic_write(path: str, payload: bytes) -> None:
+    """Write to a temporary file and swap it in so readers never see a partial save."""
+    global _save_exists
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Silently ignore save errors; re-check existence next time
+        _save_exists = None
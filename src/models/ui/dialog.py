@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 import json
+import sys
 
 from src.core.exceptions import DialogError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DialogEntry:
     """Single dialog entry with all associated data."""
     
@@ -25,6 +27,18 @@ class DialogEntry:
             raise DialogError("Dialog entry must have text")
 
 
+# Field order of a pipe-separated TXT dialog line
+_TXT_FIELDS = ('text', 'image', 'sound', 'speaker', 'portrait')
+
+
+def _intern_names(entry_data: Dict[str, Any]) -> None:
+    """Intern speaker and portrait, which repeat across lines, in place."""
+    for key in ('speaker', 'portrait'):
+        value = entry_data.get(key)
+        if value:
+            entry_data[key] = sys.intern(value)
+
+
 class DialogSequence:
     """A sequence of dialog entries."""
     
@@ -121,22 +135,20 @@ class DialogManager:
         Raises:
             DialogError: If file cannot be loaded or parsed
         """
-        if not file_path.exists():
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except OSError:
             raise DialogError(f"Dialog file not found: {file_path}")
         
         try:
-            if file_path.suffix == '.json':
-                sequence = self._load_json_dialog(file_path)
-            elif file_path.suffix == '.txt':
-                sequence = self._load_txt_dialog(file_path)
-            else:
-                raise DialogError(f"Unsupported dialog format: {file_path.suffix}")
-            
-            self._sequences[dialog_id] = sequence
-            return sequence
-            
+            entries = _load_entries_cached(str(file_path), mtime_ns)
         except (IOError, json.JSONDecodeError) as e:
             raise DialogError(f"Failed to load dialog: {e}")
+        
+        # Entries are frozen and shared; each sequence gets its own cursor
+        sequence = DialogSequence(list(entries))
+        self._sequences[dialog_id] = sequence
+        return sequence
     
     def get_sequence(self, dialog_id: str) -> Optional[DialogSequence]:
         """Get dialog sequence by ID."""
@@ -172,8 +184,9 @@ class DialogManager:
         self._sequences.clear()
         self._current_sequence = None
     
-    def _load_json_dialog(self, file_path: Path) -> DialogSequence:
-        """Load dialog from JSON format."""
+    @staticmethod
+    def _load_json_dialog(file_path: Path) -> List[DialogEntry]:
+        """Load dialog entries from JSON format."""
         with file_path.open('r', encoding='utf-8') as f:
             data = json.load(f)
         
@@ -183,14 +196,16 @@ class DialogManager:
         entries = []
         for item in data:
             if isinstance(item, dict):
+                _intern_names(item)
                 entries.append(DialogEntry(**item))
             else:
                 raise DialogError("Each dialog entry must be a dictionary")
         
-        return DialogSequence(entries)
+        return entries
     
-    def _load_txt_dialog(self, file_path: Path) -> DialogSequence:
-        """Load dialog from text format (pipe-separated)."""
+    @staticmethod
+    def _load_txt_dialog(file_path: Path) -> List[DialogEntry]:
+        """Load dialog entries from text format (pipe-separated)."""
         entries = []
         
         with file_path.open('r', encoding='utf-8') as f:
@@ -200,25 +215,36 @@ class DialogManager:
                     continue
                 
                 parts = line.split('|')
-                if not parts or not parts[0]:
+                if not parts[0]:
                     raise DialogError(f"Invalid dialog entry at line {line_num}")
                 
-                # Build entry from parts
-                entry_data = {'text': parts[0]}
-                
-                # Optional fields
-                if len(parts) > 1 and parts[1]:
-                    entry_data['image'] = parts[1]
-                if len(parts) > 2 and parts[2]:
-                    entry_data['sound'] = parts[2]
-                if len(parts) > 3 and parts[3]:
-                    entry_data['speaker'] = parts[3]
-                if len(parts) > 4 and parts[4]:
-                    entry_data['portrait'] = parts[4]
+                # Build entry from the non-empty parts; extra parts are ignored
+                entry_data = {key: value for key, value in zip(_TXT_FIELDS, parts) if value}
+                _intern_names(entry_data)
                 
                 entries.append(DialogEntry(**entry_data))
         
-        return DialogSequence(entries)
+        return entries
+
+
+@lru_cache(maxsize=32)
+def _load_entries_cached(path_str: str, mtime_ns: int) -> Tuple[DialogEntry, ...]:
+    """
+    Parse a dialog file once per modification time.
+    
+    Args:
+        path_str: Path to dialog file (JSON or TXT)
+        mtime_ns: File modification time, part of the cache key so edits reload
+        
+    Returns:
+        Immutable tuple of dialog entries
+    """
+    file_path = Path(path_str)
+    if file_path.suffix == '.json':
+        return tuple(DialogManager._load_json_dialog(file_path))
+    if file_path.suffix == '.txt':
+        return tuple(DialogManager._load_txt_dialog(file_path))
+    raise DialogError(f"Unsupported dialog format: {file_path.suffix}")
 
 
 # Singleton instance
@@ -1,15 +1,22 @@
 """Level model for game world management."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from pathlib import Path
 import pygame as pg
 import pytmx
 
 from src.models.world.tile import Tile, TileProperties, AnimatedTile, TriggerTile
-from src.core.constants import TILE_SIZE
+from src.core.constants import TILE_SIZE, LEVEL_CHUNK_TILES, LEVEL_CHUNK_MARGIN
 from src.core.exceptions import LevelError
-from src.core.cache_manager import get_cache_manager
+
+
+# Tiles indexed by the grid cell holding their rect's top-left corner. Each
+# cell keeps parallel lists of rects and tiles so overlap tests run in C.
+TileGrid = Dict[Tuple[int, int], Tuple[List[pg.Rect], List[Tile]]]
+
+# Pre-rendered chunk surfaces, one per visible layer with tiles in the chunk
+ChunkSurfaces = List[pg.Surface]
 
 
 class TileLayer:
@@ -152,9 +159,23 @@ class Level:
         self._tile_size = TILE_SIZE
         self._entities_to_spawn: List[Dict] = []
         
-        # Use centralized cache manager
-        self._cache_manager = get_cache_manager()
-        self._cache_key_prefix = f"level_{level_id}"
+        # Spatial index of visible tiles for collision queries
+        self._collidable_grid: TileGrid = {}
+        self._platform_grid: TileGrid = {}
+        self._ground_grid: TileGrid = {}  # Collidable and platform tiles together
+        self._hazard_grid: TileGrid = {}
+        
+        # Merged per-kind tile groups, built on first request. Destroyed
+        # tiles leave them through kill(), so they only reset on reload.
+        self._tile_group_cache: Dict[str, pg.sprite.Group] = {}
+        
+        # Union of each trigger group's tile rects, for cheap early rejection
+        self._trigger_bbox: Dict[str, Optional[pg.Rect]] = {}
+        
+        # Offscreen renders of LEVEL_CHUNK_TILES square tile blocks, keyed
+        # by chunk coordinate and built the first time a chunk is on screen.
+        # Only chunks within LEVEL_CHUNK_MARGIN of the view are kept.
+        self._chunk_cache: Dict[Tuple[int, int], ChunkSurfaces] = {}
     
     @property
     def level_id(self) -> str:
@@ -196,6 +217,26 @@ class Level:
         """Get level height in tiles."""
         return self._bounds.height // self._tile_size
     
+    @property
+    def collidable_grid(self) -> TileGrid:
+        """Get grid index of collidable tiles."""
+        return self._collidable_grid
+    
+    @property
+    def platform_grid(self) -> TileGrid:
+        """Get grid index of one-way platform tiles."""
+        return self._platform_grid
+    
+    @property
+    def ground_grid(self) -> TileGrid:
+        """Get grid index of every tile that can be stood on."""
+        return self._ground_grid
+    
+    @property
+    def hazard_grid(self) -> TileGrid:
+        """Get grid index of hazardous tiles."""
+        return self._hazard_grid
+    
     @property
     def entities_to_spawn(self) -> List[Dict]:
         """Get list of entities to spawn in level."""
@@ -210,6 +251,7 @@ class Level:
             self._tmx_data = pytmx.load_pygame(str(tmx_path))
             self._load_level_properties()
             self._create_tile_layers()
+            self._build_collision_grids()
             self._load_object_layers()
             
             # Invalidate collision caches when level is loaded
@@ -244,59 +286,114 @@ class Level:
     
     def get_all_collidable_tiles(self) -> pg.sprite.Group:
         """Get all collidable tiles from all layers with caching."""
-        cache_key = f"{self._cache_key_prefix}_collidable"
-        cached_group = self._cache_manager.get("collision_groups", cache_key)
-        
-        if cached_group is None:
-            cached_group = pg.sprite.Group()
-            for layer in self._layers.values():
-                if layer.visible:
-                    cached_group.add(layer.collidable_tiles)
-            self._cache_manager.put("collision_groups", cache_key, cached_group, ttl=5.0)
-        
-        return cached_group
+        return self._get_merged_group("collidable", lambda layer: layer.collidable_tiles)
     
     def get_all_hazard_tiles(self) -> pg.sprite.Group:
         """Get all hazard tiles from all layers with caching."""
-        cache_key = f"{self._cache_key_prefix}_hazard"
-        cached_group = self._cache_manager.get("collision_groups", cache_key)
-        
-        if cached_group is None:
-            cached_group = pg.sprite.Group()
-            for layer in self._layers.values():
-                if layer.visible:
-                    cached_group.add(layer.hazard_tiles)
-            self._cache_manager.put("collision_groups", cache_key, cached_group, ttl=5.0)
-        
-        return cached_group
+        return self._get_merged_group("hazard", lambda layer: layer.hazard_tiles)
     
     def get_all_platform_tiles(self) -> pg.sprite.Group:
         """Get all platform tiles from all layers with caching."""
-        cache_key = f"{self._cache_key_prefix}_platform"
-        cached_group = self._cache_manager.get("collision_groups", cache_key)
-        
-        if cached_group is None:
-            cached_group = pg.sprite.Group()
-            for layer in self._layers.values():
-                if layer.visible:
-                    cached_group.add(layer.platform_tiles)
-            self._cache_manager.put("collision_groups", cache_key, cached_group, ttl=5.0)
-        
-        return cached_group
+        return self._get_merged_group("platform", lambda layer: layer.platform_tiles)
     
     def get_all_trigger_tiles(self, trigger_id: str) -> pg.sprite.Group:
         """Get all trigger tiles with specific ID from all layers with caching."""
-        cache_key = f"{self._cache_key_prefix}_trigger_{trigger_id}"
-        cached_group = self._cache_manager.get("collision_groups", cache_key)
+        return self._get_merged_group(
+            f"trigger_{trigger_id}",
+            lambda layer: layer.get_trigger_tiles(trigger_id)
+        )
+    
+    def get_trigger_bounds(self, trigger_id: str) -> Optional[pg.Rect]:
+        """
+        Get the rectangle enclosing every tile of a trigger.
         
-        if cached_group is None:
-            cached_group = pg.sprite.Group()
-            for layer in self._layers.values():
-                if layer.visible:
-                    cached_group.add(layer.get_trigger_tiles(trigger_id))
-            self._cache_manager.put("collision_groups", cache_key, cached_group, ttl=5.0)
+        Args:
+            trigger_id: Trigger identifier
+            
+        Returns:
+            Union of the trigger tile rects, or None if the level has none
+        """
+        if trigger_id not in self._trigger_bbox:
+            rects = [tile.rect for tile in self.get_all_trigger_tiles(trigger_id)]
+            self._trigger_bbox[trigger_id] = rects[0].unionall(rects) if rects else None
+        return self._trigger_bbox[trigger_id]
+    
+    def query_tiles(self, rect: pg.Rect, grid: TileGrid) -> List[Tile]:
+        """
+        Get tiles from a grid index that overlap a rectangle.
+        
+        Only the grid cells covered by the rectangle are inspected, so the
+        cost depends on the rectangle size rather than the level size.
+        
+        Args:
+            rect: World-space rectangle to test
+            grid: One of the level's tile grid indexes
+            
+        Returns:
+            Overlapping tiles in row-major cell order
+        """
+        rects, tiles = self._gather_cells(rect, grid)
+        if not rects:
+            return []
+        
+        # Destroyed tiles are killed but stay in the index
+        return [
+            tiles[index] for index in rect.collidelistall(rects)
+            if tiles[index].alive()
+        ]
+    
+    def query_rects(self, rect: pg.Rect, grid: TileGrid) -> List[pg.Rect]:
+        """
+        Get bounding rects of grid tiles that overlap a rectangle.
+        
+        Same as query_tiles but returns only geometry, for collision
+        resolution that never needs the tile objects themselves.
+        
+        Args:
+            rect: World-space rectangle to test
+            grid: One of the level's tile grid indexes
+            
+        Returns:
+            Overlapping tile rects in row-major cell order
+        """
+        rects, tiles = self._gather_cells(rect, grid)
+        if not rects:
+            return []
+        
+        return [
+            rects[index] for index in rect.collidelistall(rects)
+            if tiles[index].alive()
+        ]
+    
+    def overlaps_tiles(self, rect: pg.Rect, grid: TileGrid) -> bool:
+        """
+        Check whether any tile from a grid index overlaps a rectangle.
         
-        return cached_group
+        Same cell range as query_tiles, but stops at the first hit.
+        
+        Args:
+            rect: World-space rectangle to test
+            grid: One of the level's tile grid indexes
+            
+        Returns:
+            True if at least one tile overlaps
+        """
+        tile_size = self._tile_size
+        start_x = rect.left // tile_size - 1
+        end_x = (rect.right - 1) // tile_size
+        start_y = rect.top // tile_size - 1
+        end_y = (rect.bottom - 1) // tile_size
+        
+        for gy in range(start_y, end_y + 1):
+            for gx in range(start_x, end_x + 1):
+                cell = grid.get((gx, gy))
+                if cell is None:
+                    continue
+                cell_tiles = cell[1]
+                for index in rect.collidelistall(cell[0]):
+                    if cell_tiles[index].alive():
+                        return True
+        return False
     
     def get_visible_tiles(self, camera_rect: pg.Rect) -> List[Tuple[Tile, TileLayer]]:
         """Get tiles visible in camera view with their layers (indexed lookup)."""
@@ -318,6 +415,62 @@ class Level:
                         visible_tiles.append((tile, layer))
         return visible_tiles
     
+    def visible_chunks(self, camera_rect: pg.Rect) -> List[Tuple[Tuple[int, int], ChunkSurfaces]]:
+        """
+        Get pre-rendered chunks overlapping the camera view.
+        
+        Args:
+            camera_rect: World-space camera viewport
+            
+        Returns:
+            List of (world top-left, layer surfaces) pairs in drawing order
+        """
+        chunk_px = self._tile_size * LEVEL_CHUNK_TILES
+        
+        # Tiles overhang their grid corner by half a tile, so the chunk row
+        # and column just outside the level bounds can hold tile pixels
+        min_cx = -self._tile_size // chunk_px
+        min_cy = min_cx
+        max_cx = (self._bounds.right + self._tile_size) // chunk_px
+        max_cy = (self._bounds.bottom + self._tile_size) // chunk_px
+        
+        start_x = max(min_cx, camera_rect.left // chunk_px)
+        end_x = min(max_cx, (camera_rect.right - 1) // chunk_px)
+        start_y = max(min_cy, camera_rect.top // chunk_px)
+        end_y = min(max_cy, (camera_rect.bottom - 1) // chunk_px)
+        
+        chunk_cache = self._chunk_cache
+        chunks: List[Tuple[Tuple[int, int], ChunkSurfaces]] = []
+        built = False
+        for cy in range(start_y, end_y + 1):
+            for cx in range(start_x, end_x + 1):
+                surfaces = chunk_cache.get((cx, cy))
+                if surfaces is None:
+                    surfaces = self._build_chunk(cx, cy)
+                    chunk_cache[(cx, cy)] = surfaces
+                    built = True
+                if surfaces:
+                    chunks.append(((cx * chunk_px, cy * chunk_px), surfaces))
+        
+        # The view moved onto new chunks; drop the ones it left behind
+        if built:
+            self._prune_chunks(start_x, start_y, end_x, end_y)
+        return chunks
+    
+    def _prune_chunks(self, start_x: int, start_y: int, end_x: int, end_y: int) -> None:
+        """Drop cached chunks further than LEVEL_CHUNK_MARGIN from a visible range."""
+        min_x = start_x - LEVEL_CHUNK_MARGIN
+        max_x = end_x + LEVEL_CHUNK_MARGIN
+        min_y = start_y - LEVEL_CHUNK_MARGIN
+        max_y = end_y + LEVEL_CHUNK_MARGIN
+        chunk_cache = self._chunk_cache
+        stale = [
+            key for key in chunk_cache
+            if not (min_x <= key[0] <= max_x and min_y <= key[1] <= max_y)
+        ]
+        for key in stale:
+            del chunk_cache[key]
+    
     def get_tile_at_position(self, world_x: float, world_y: float, layer_name: Optional[str] = None) -> Optional[Tile]:
         """Get tile at world position."""
         grid_x = int(world_x // self._tile_size)
@@ -344,29 +497,92 @@ class Level:
             layer.cleanup()
         self._layers.clear()
         self._layer_order.clear()
+        self._collidable_grid.clear()
+        self._platform_grid.clear()
+        self._ground_grid.clear()
+        self._hazard_grid.clear()
+        self._chunk_cache.clear()
         
         # Invalidate all caches related to this level
         self._invalidate_collision_cache()
     
     def _invalidate_collision_cache(self) -> None:
         """Invalidate collision-related caches."""
-        # Remove all collision caches for this level
-        cache_keys = [
-            f"{self._cache_key_prefix}_collidable",
-            f"{self._cache_key_prefix}_hazard", 
-            f"{self._cache_key_prefix}_platform"
-        ]
+        self._tile_group_cache.clear()
+        self._trigger_bbox.clear()
+    
+    def _get_merged_group(
+        self,
+        key: str,
+        select: Callable[[TileLayer], pg.sprite.Group]
+    ) -> pg.sprite.Group:
+        """
+        Get cached union of a tile group across all visible layers.
         
-        # Also invalidate trigger caches
-        for layer in self._layers.values():
-            for trigger_id in layer._trigger_tiles.keys():
-                cache_keys.append(f"{self._cache_key_prefix}_trigger_{trigger_id}")
+        Args:
+            key: Cache key for the group kind
+            select: Picks the group to merge from each layer
+            
+        Returns:
+            Merged sprite group
+        """
+        group = self._tile_group_cache.get(key)
+        if group is None:
+            group = pg.sprite.Group()
+            for layer in self._layers.values():
+                if layer.visible:
+                    group.add(select(layer))
+            self._tile_group_cache[key] = group
+        return group
+    
+    def _build_chunk(self, cx: int, cy: int) -> ChunkSurfaces:
+        """
+        Render every visible layer's tiles inside one chunk offscreen.
         
-        # Clear from cache
-        collision_cache = self._cache_manager.get_cache("collision_groups")
-        if collision_cache:
-            for key in cache_keys:
-                collision_cache.remove(key)
+        Args:
+            cx: Chunk X coordinate
+            cy: Chunk Y coordinate
+            
+        Returns:
+            One surface per layer with tiles in the chunk, in drawing order
+        """
+        tile_size = self._tile_size
+        chunk_px = tile_size * LEVEL_CHUNK_TILES
+        origin_x = cx * chunk_px
+        origin_y = cy * chunk_px
+        
+        # One extra cell on each side catches tiles overhanging the border
+        start_gx = cx * LEVEL_CHUNK_TILES - 1
+        start_gy = cy * LEVEL_CHUNK_TILES - 1
+        end_gx = start_gx + LEVEL_CHUNK_TILES + 1
+        end_gy = start_gy + LEVEL_CHUNK_TILES + 1
+        
+        surfaces: ChunkSurfaces = []
+        for layer in self.get_layers_in_order():
+            if not layer.visible:
+                continue
+            surface: Optional[pg.Surface] = None
+            for gy in range(start_gy, end_gy + 1):
+                for gx in range(start_gx, end_gx + 1):
+                    tile = layer.get_tile_at(gx, gy)
+                    if tile is None or not tile.alive():
+                        continue
+                    if surface is None:
+                        surface = pg.Surface((chunk_px, chunk_px), pg.SRCALPHA)
+                    # Tiles of a layer never overlap, so copy pixels verbatim
+                    # instead of alpha blending them against the empty chunk
+                    surface.blit(
+                        tile.image,
+                        (tile.rect.x - origin_x, tile.rect.y - origin_y),
+                        special_flags=pg.BLEND_RGBA_MAX
+                    )
+            if surface is None:
+                continue
+            surface = surface.convert_alpha()
+            if layer.opacity < 1.0:
+                surface.set_alpha(int(255 * layer.opacity))
+            surfaces.append(surface)
+        return surfaces
     
     def _load_level_properties(self) -> None:
         """Load properties from TMX data."""
@@ -447,6 +663,53 @@ class Level:
                 self._layer_order.append(tmx_layer.name)
                 layer_index += 1
     
+    def _gather_cells(
+        self,
+        rect: pg.Rect,
+        grid: TileGrid
+    ) -> Tuple[List[pg.Rect], List[Tile]]:
+        """
+        Collect candidate rects and tiles from the grid cells a rect covers.
+        
+        Tiles are at most one tile wide and are keyed by their top-left
+        corner, so one extra cell to the left and above is included.
+        """
+        tile_size = self._tile_size
+        start_x = rect.left // tile_size - 1
+        end_x = (rect.right - 1) // tile_size
+        start_y = rect.top // tile_size - 1
+        end_y = (rect.bottom - 1) // tile_size
+        
+        rects: List[pg.Rect] = []
+        tiles: List[Tile] = []
+        for gy in range(start_y, end_y + 1):
+            for gx in range(start_x, end_x + 1):
+                cell = grid.get((gx, gy))
+                if cell is not None:
+                    rects.extend(cell[0])
+                    tiles.extend(cell[1])
+        return rects, tiles
+    
+    def _build_collision_grids(self) -> None:
+        """Index collidable, platform, ground and hazard tiles of visible layers by cell."""
+        tile_size = self._tile_size
+        for layer in self.get_layers_in_order():
+            if not layer.visible:
+                continue
+            for group, grids in (
+                (layer.collidable_tiles, (self._collidable_grid, self._ground_grid)),
+                (layer.platform_tiles, (self._platform_grid, self._ground_grid)),
+                (layer.hazard_tiles, (self._hazard_grid,)),
+            ):
+                for tile in group:
+                    # Tile rects are centred on their grid corner, so key by rect
+                    tile_rect = tile.rect
+                    cell = (tile_rect.left // tile_size, tile_rect.top // tile_size)
+                    for grid in grids:
+                        rects, tiles = grid.setdefault(cell, ([], []))
+                        rects.append(tile_rect)
+                        tiles.append(tile)
+    
     def _load_object_layers(self) -> None:
         """Load object layers for spawn points and entities."""
         if not self._tmx_data:
@@ -51,6 +51,11 @@ class TileProperties:
 class Tile(StaticEntity):
     """Single tile in the game world."""
     
+    __slots__ = (
+        '_grid_x', '_grid_y', '_tile_size', '_tile_id', '_properties',
+        '_animation_frames', '_current_frame', '_animation_speed', '_animation_timer'
+    )
+    
     def __init__(
         self,
         grid_x: int,
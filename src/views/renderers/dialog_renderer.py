@@ -1,7 +1,7 @@
 """Dialog renderer for both standalone scenes and overlays."""
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 import pygame as pg
 
 from src.views.ui.dialog_overlay import DialogOverlay
@@ -21,6 +21,7 @@ class DialogRenderer(IRenderer):
         self._fade_target = 1.0
         self._fade_speed = 0.02
         self._last_update_time = 0
+        self._star_rects: List[pg.Rect] = []
         
     def set_sequence(self, sequence: DialogSequence) -> None:
         """Set dialog sequence to render."""
@@ -34,8 +35,15 @@ class DialogRenderer(IRenderer):
         """Handle input event."""
         return self._overlay.handle_event(event)
     
-    def render(self, surface: pg.Surface) -> None:
-        """Render dialog scene."""
+    def render(self, surface: pg.Surface) -> List[pg.Rect]:
+        """
+        Render dialog scene.
+        
+        Returns:
+            Screen areas changed since the previous frame
+        """
+        was_animating = self.is_animating()
+        
         # Update fade animation
         current_time = pg.time.get_ticks()
         if self._last_update_time > 0:
@@ -62,11 +70,21 @@ class DialogRenderer(IRenderer):
         
         # Render dialog
         self._overlay.render(surface)
+        
+        # Transitions move everything; once idle only the stars twinkle and
+        # the scroll indicator bounces inside the text box
+        if was_animating or self.is_animating():
+            return [surface.get_rect()]
+        return self._star_rects + [self._overlay.get_text_box_rect()]
     
     def update_screen_size(self, width: int, height: int) -> None:
         """Update renderer for new screen dimensions."""
         self._overlay.update_screen_size(width, height)
     
+    def is_animating(self) -> bool:
+        """Check if any transition animation is still running."""
+        return self._fade_progress != self._fade_target or self._overlay.is_animating()
+    
     def is_finished(self) -> bool:
         """Check if dialog sequence has finished."""
         sequence = self._overlay._sequence
@@ -98,10 +116,14 @@ class DialogRenderer(IRenderer):
                 size = random.choice([1, 1, 1, 2])  # Most stars are small
                 twinkle_speed = random.uniform(0.5, 2.0)
                 self._star_positions.append((x, y, brightness, size, twinkle_speed))
+                if size == 1:
+                    self._star_rects.append(pg.Rect(x, y, 1, 1))
+                else:
+                    self._star_rects.append(pg.Rect(x - size * 3, y - size * 3, size * 6, size * 6))
         
         # Draw twinkling stars
         import math
-        time = pg.time.get_ticks() / 1000.0
+        time = self._last_update_time / 1000.0  # Frame timestamp taken in render()
         for x, y, max_brightness, size, speed in self._star_positions:
             # Calculate twinkle effect
             brightness = int(max_brightness * (0.5 + 0.5 * math.sin(time * speed)))
@@ -6,8 +6,9 @@ import pygame as pg
 
 from src.views.camera import Camera
 from src.views.ui.hud import HUDRenderer
+from src.views.ui.fonts import get_font
 from src.models.entities.player import Player
-from src.models.world.level import Level, Tile
+from src.models.world.level import Level
 from src.core.interfaces import IRenderer
 from src.core.cache_manager import get_cache_manager
 
@@ -84,34 +85,19 @@ class GameRenderer(IRenderer):
         self._hud_renderer.update_screen_size(width, height)
     
     def _render_level(self, surface: pg.Surface, level: Level, camera_rect: pg.Rect) -> None:
-        """Render visible level tiles."""
-        # Get visible tiles
-        visible_tiles = level.get_visible_tiles(camera_rect)
+        """Render visible level chunks from the level's offscreen cache."""
+        offset_x, offset_y = camera_rect.topleft
+        blits = [
+            (chunk_surface, (world_x - offset_x, world_y - offset_y))
+            for (world_x, world_y), surfaces in level.visible_chunks(camera_rect)
+            for chunk_surface in surfaces
+        ]
+        surface.blits(blits, False)
         
-        # Sort by layer order (if needed)
-        # For now, just render all tiles
-        for tile, layer in visible_tiles:
-            screen_rect = self._camera.apply_to_entity(tile)
-            
-            # Apply layer opacity if needed
-            if layer.opacity < 1.0:
-                cache_key = (tile.tile_id or id(tile.image), layer.opacity)
-                
-                # Try to get from cache
-                tile_surface = self._cache_manager.get("tile_surfaces", cache_key)
-                
-                if tile_surface is None:
-                    # Create and cache the surface
-                    tile_surface = tile.image.copy()
-                    tile_surface.set_alpha(int(255 * layer.opacity))
-                    self._cache_manager.put("tile_surfaces", cache_key, tile_surface)
-                
-                surface.blit(tile_surface, screen_rect)
-            else:
-                surface.blit(tile.image, screen_rect)
-            
-            # Debug: Show tile properties
-            if self._debug_mode:
+        # Debug: Show tile properties
+        if self._debug_mode:
+            for tile, _layer in level.get_visible_tiles(camera_rect):
+                screen_rect = self._camera.apply_to_entity(tile)
                 if tile.is_collidable:
                     pg.draw.rect(surface, (255, 0, 0), screen_rect, 1)
                 elif tile.is_hazardous:
@@ -133,7 +119,7 @@ class GameRenderer(IRenderer):
     
     def _render_debug(self, surface: pg.Surface, player: Player, entities: pg.sprite.Group) -> None:
         """Render debug information."""
-        debug_font = pg.font.Font(None, 20)
+        debug_font = get_font(20)
         
         # Get cache stats
         cache_stats = self._cache_manager.get_stats()
@@ -80,6 +80,11 @@ class MenuRenderer(IRenderer):
         self._button_images: dict[str, pg.Surface] = {}
         self._load_assets()
     
+    @property
+    def items(self) -> List[MenuItem]:
+        """Get displayed menu items."""
+        return self._items
+    
     def set_menu_items(self, items: List[MenuItem]) -> None:
         """Set menu items to display (assigning images automatically)."""
         self._items = items
@@ -7,6 +7,7 @@ import pygame as pg
 
 from src.core.constants import UIConstants, BACKGROUND_COLOR
 from src.core.interfaces import IRenderer
+from src.views.ui.fonts import get_font
 
 
 class SettingType(Enum):
@@ -46,6 +47,10 @@ class SettingsRenderer(IRenderer):
         self._screen_size = (800, 600)
         self._font: Optional[pg.font.Font] = None
         
+        # Static text pre-rendered once
+        self._title_surface: Optional[pg.Surface] = None
+        self._instruction_surfaces: List[pg.Surface] = []
+        
         # Settings items
         self._items: List[SettingItem] = []
         
@@ -55,6 +60,11 @@ class SettingsRenderer(IRenderer):
         # Initialize
         self._initialize()
     
+    @property
+    def items(self) -> List[SettingItem]:
+        """Get displayed setting items."""
+        return self._items
+    
     def set_items(self, items: List[SettingItem]) -> None:
         """Set settings items to display."""
         self._items = items
@@ -126,7 +136,17 @@ class SettingsRenderer(IRenderer):
     
     def _initialize(self) -> None:
         """Initialize renderer assets."""
-        self._font = pg.font.Font(None, UIConstants.FONT_SIZE_MEDIUM)
+        self._font = get_font(UIConstants.FONT_SIZE_MEDIUM)
+        
+        self._title_surface = get_font(UIConstants.FONT_SIZE_LARGE).render(
+            "SETTINGS", True, (255, 255, 255)
+        ).convert_alpha()
+        
+        instruction_font = get_font(24)
+        self._instruction_surfaces = [
+            instruction_font.render(instruction, True, (150, 150, 150)).convert_alpha()
+            for instruction in ("Click to modify settings", "ESC to return to menu")
+        ]
     
     def _layout_items(self) -> None:
         """Calculate item positions."""
@@ -163,13 +183,11 @@ class SettingsRenderer(IRenderer):
     
     def _draw_title(self, surface: pg.Surface) -> None:
         """Draw settings title."""
-        if not self._font:
+        if not self._title_surface:
             return
             
-        title_font = pg.font.Font(None, UIConstants.FONT_SIZE_LARGE)
-        title_text = title_font.render("SETTINGS", True, (255, 255, 255))
-        title_rect = title_text.get_rect(centerx=self._screen_size[0] // 2, top=50)
-        surface.blit(title_text, title_rect)
+        title_rect = self._title_surface.get_rect(centerx=self._screen_size[0] // 2, top=50)
+        surface.blit(self._title_surface, title_rect)
     
     def _draw_items(self, surface: pg.Surface) -> None:
         """Draw all settings items."""
@@ -233,18 +251,8 @@ class SettingsRenderer(IRenderer):
     
     def _draw_instructions(self, surface: pg.Surface) -> None:
         """Draw instruction text at bottom."""
-        if not self._font:
-            return
-            
-        instruction_font = pg.font.Font(None, 24)
-        instructions = [
-            "Click to modify settings",
-            "ESC to return to menu"
-        ]
-        
         y = self._screen_size[1] - 60
-        for instruction in instructions:
-            text = instruction_font.render(instruction, True, (150, 150, 150))
+        for text in self._instruction_surfaces:
             text_rect = text.get_rect(centerx=self._screen_size[0] // 2, top=y)
             surface.blit(text, text_rect)
             y += 25
\ No newline at end of file
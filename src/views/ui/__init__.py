@@ -1,3 +1,4 @@
 """UI view components."""
 from src.views.ui.hud import HUDRenderer
 from src.views.ui.dialog_overlay import DialogOverlay
+from src.views.ui.fonts import get_font
@@ -77,10 +77,33 @@ class DialogOverlay(IOverlay):
         self._portrait_scale_target = 0.0
         self._stop_current_sound()
     
+    def reset(self) -> None:
+        """Immediately clear the sequence and hide without animation."""
+        self._stop_current_sound()
+        self._sequence = None
+        self._visible = False
+        self._fade_alpha = 0
+        self._last_update_time = 0
+    
     def is_visible(self) -> bool:
         """Check if overlay is visible."""
         return self._visible or self._fade_alpha > 0
     
+    def is_animating(self) -> bool:
+        """Check if fade, slide or portrait scale animation is in progress."""
+        return (
+            self._fade_alpha != self._fade_target
+            or self._text_box_offset != self._text_box_offset_target
+            or self._portrait_scale != self._portrait_scale_target
+        )
+    
+    def get_text_box_rect(self) -> pg.Rect:
+        """Get on-screen area of the text box, including its drop shadow."""
+        rect = self._text_box_rect.move(0, self._text_box_offset)
+        rect.width += 5
+        rect.height += 5
+        return rect
+    
     def set_sequence(self, sequence: DialogSequence) -> None:
         """Set dialog sequence to display."""
         self._sequence = sequence
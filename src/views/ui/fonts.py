@@ -0,0 +1,26 @@
+"""Shared font cache for views."""
+from __future__ import annotations
+
+from typing import Dict
+import pygame as pg
+
+
+# Default-typeface fonts by point size, created on first use
+_FONT_CACHE: Dict[int, pg.font.Font] = {}
+
+
+def get_font(size: int) -> pg.font.Font:
+    """
+    Get the default font at a size, loading it only once.
+    
+    Args:
+        size: Font size in points
+        
+    Returns:
+        Shared font instance
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = pg.font.Font(None, size)
+        _FONT_CACHE[size] = font
+    return font